@@ -11,7 +11,9 @@ logger.addHandler(logging.NullHandler())
 from .constants import CubeAnchor
 from .model import VoxelModel
 # Expose the writer factory function and specific writers if direct use is desired
-from .writers import get_writer, StlAsciiWriter, StlBinaryWriter, MeshWriterBase
+from .writers import get_writer, StlAsciiWriter, StlBinaryWriter, PlyQuantizedWriter, MeshWriterBase
+# Ready-made shapes
+from .primitives import hollow_box, checkerboard
 
 # Define what gets imported with 'from cubeforge import *'
 __all__ = [
@@ -21,6 +23,9 @@ __all__ = [
     'MeshWriterBase',    # Allow extending with custom writers
     'StlAsciiWriter',    # Allow direct instantiation if needed
     'StlBinaryWriter',   # Allow direct instantiation if needed
+    'PlyQuantizedWriter',
+    'hollow_box',        # Ready-made shapes
+    'checkerboard',
 ]
 
 # Define package version
@@ -1,5 +1,8 @@
 # cubeforge/model.py
 import logging
+import re
+from array import array
+from operator import itemgetter
 from .constants import CubeAnchor
 from .writers import get_writer # Use the generalized writer system
 
@@ -7,6 +10,554 @@ from .writers import get_writer # Use the generalized writer system
 # Get a logger instance for this module. Configuration is left to the application.
 logger = logging.getLogger(__name__)
 
+# Voxels are keyed by a single packed integer rather than an (ix, iy, iz) tuple.
+# Each grid index gets a 21-bit field, offset so that negative indices are
+# stored as non-negative values. Because the packing is linear, the key of a
+# neighboring cell is the voxel's key plus a constant stride.
+_KEY_BITS = 21
+_KEY_MASK = (1 << _KEY_BITS) - 1
+_KEY_OFFSET = 1 << (_KEY_BITS - 1)
+_KEY_STRIDES = (1, 1 << _KEY_BITS, 1 << (2 * _KEY_BITS))  # +1 step along X, Y, Z
+_KEY_BASE = _KEY_OFFSET * (_KEY_STRIDES[0] + _KEY_STRIDES[1] + _KEY_STRIDES[2])
+# Largest grid index magnitude that still leaves room for +/-1 neighbor probes
+_GRID_INDEX_LIMIT = _KEY_OFFSET - 1
+
+# Greedy meshing switches to a dense occupancy bitset when the bounding box of
+# the model, with rows rounded up to whole bytes, has at most this many cells
+# (2 MiB of bits).
+_DENSE_GRID_MAX_CELLS = 1 << 24
+# Runs of nonzero bytes, used to find the nonempty rows of occupancy bitsets
+_NONZERO_RUN = re.compile(rb'[^\x00]+')
+# A face overlapped by more neighbor faces than this has them subtracted in one
+# sweep rather than one at a time (only with exact grid-unit coordinates)
+_SWEEP_MIN_COVERS = 16
+
+# The six outward unit normals keyed by (axis, direction), shared by every
+# emitted triangle, and the same normals with Y/Z swapped for Z-up output.
+_NORMALS = {
+    (0, 0): (-1, 0, 0), (0, 1): (1, 0, 0),
+    (1, 0): (0, -1, 0), (1, 1): (0, 1, 0),
+    (2, 0): (0, 0, -1), (2, 1): (0, 0, 1),
+}
+_NORMALS_ZUP = {face: (n[0], n[2], n[1]) for face, n in _NORMALS.items()}
+
+# Corner order giving counter-clockwise winding (seen from outside) for each
+# (axis, direction) face, as indices into the corners
+# (u0, v0), (u1, v0), (u0, v1), (u1, v1) built by _quad_triangles_y_up.
+_WINDING = {
+    (0, 0): (0, 2, 3, 1),  # -X face
+    (0, 1): (0, 1, 3, 2),  # +X face
+    (1, 0): (0, 2, 3, 1),  # -Y face (looking up from below)
+    (1, 1): (0, 1, 3, 2),  # +Y face (looking down from above)
+    (2, 0): (0, 2, 3, 1),  # -Z face
+    (2, 1): (0, 1, 3, 2),  # +Z face
+}
+
+# The two triangles (c0, c1, c2) and (c0, c2, c3) of each wound quad, as
+# indices into the unwound corners, so a quad is split without reordering.
+_QUAD_TRIANGLES = {face: ((w[0], w[1], w[2]), (w[0], w[2], w[3])) for face, w in _WINDING.items()}
+
+# Position of each anchor point within a voxel, as a fraction (0, 0.5 or 1) of
+# the voxel size along each internal axis, measured from the minimum corner.
+# Only BOTTOM_CENTER and TOP_CENTER depend on the coordinate system.
+_ANCHOR_OFFSETS = {
+    'y_up': {
+        CubeAnchor.CORNER_NEG: (0.0, 0.0, 0.0),
+        CubeAnchor.CENTER: (0.5, 0.5, 0.5),
+        CubeAnchor.CORNER_POS: (1.0, 1.0, 1.0),
+        CubeAnchor.BOTTOM_CENTER: (0.5, 0.0, 0.5),  # Center of min Y face
+        CubeAnchor.TOP_CENTER: (0.5, 1.0, 0.5),     # Center of max Y face
+    },
+    'z_up': {
+        CubeAnchor.CORNER_NEG: (0.0, 0.0, 0.0),
+        CubeAnchor.CENTER: (0.5, 0.5, 0.5),
+        CubeAnchor.CORNER_POS: (1.0, 1.0, 1.0),
+        CubeAnchor.BOTTOM_CENTER: (0.5, 0.5, 0.0),  # Center of min Z face
+        CubeAnchor.TOP_CENTER: (0.5, 0.5, 1.0),     # Center of max Z face
+    },
+}
+
+
+def _pack_grid_coord(gx, gy, gz):
+    """Packs integer grid coordinates into a voxel key."""
+    if not (-_GRID_INDEX_LIMIT < gx < _GRID_INDEX_LIMIT and
+            -_GRID_INDEX_LIMIT < gy < _GRID_INDEX_LIMIT and
+            -_GRID_INDEX_LIMIT < gz < _GRID_INDEX_LIMIT):
+        raise ValueError(
+            f"Voxel grid coordinate ({gx}, {gy}, {gz}) is outside the supported "
+            f"range of +/-{_GRID_INDEX_LIMIT - 1} grid cells."
+        )
+    return _KEY_BASE + gx + gy * _KEY_STRIDES[1] + gz * _KEY_STRIDES[2]
+
+
+def _unpack_grid_key(key):
+    """Unpacks a voxel key back into integer grid coordinates (gx, gy, gz)."""
+    return ((key & _KEY_MASK) - _KEY_OFFSET,
+            ((key >> _KEY_BITS) & _KEY_MASK) - _KEY_OFFSET,
+            (key >> (2 * _KEY_BITS)) - _KEY_OFFSET)
+
+
+def _greedy_merge_rows(rows):
+    """
+    Greedily merges the set cells of a 2D slice into rectangles.
+
+    The slice is given as one bitmask per row, so finding and clearing runs of
+    cells are integer bit operations rather than per-cell lookups. Rows are
+    scanned in increasing v; each run of set bits is taken as wide as possible
+    along u, then extended along v while the following rows contain the whole
+    run.
+
+    This stays plain Python rather than a JIT kernel (e.g. Numba): rows are
+    arbitrary-width ints, which cannot be typed as fixed 64-bit words once a
+    row is wider than 64 cells, and the package has no runtime dependencies.
+
+    Args:
+        rows (dict): Maps the row index v to an int whose bit u is set when
+                     cell (u, v) is filled.
+
+    Returns:
+        list: (u0, v0, u1, v1) rectangles in cell units, end-exclusive.
+    """
+    rectangles = []
+    # Lay out only the rows that are present, in increasing v, so the cost
+    # follows the number of rows rather than the span of their indices. A
+    # trailing empty row stops every extension along v.
+    row_indices = sorted(rows)
+    masks = [rows[v] for v in row_indices]
+    masks.append(0)
+    for i, v in enumerate(row_indices):
+        mask = masks[i]
+        while mask:
+            low = mask & -mask
+            # Adding the lowest set bit carries through the run above it,
+            # leaving the first clear bit past the run.
+            run_end = (mask + low) & ~mask
+            run = run_end - low
+
+            # Extend along v while the following rows contain the whole run,
+            # taking it out of each of them; a gap in the row indices stops
+            # the run
+            end = i + 1
+            while masks[end] & run == run and row_indices[end] - end == v - i:
+                masks[end] ^= run
+                end += 1
+
+            mask ^= run
+            rectangles.append((low.bit_length() - 1, v, run_end.bit_length() - 1, v + end - i))
+    return rectangles
+
+
+# The six voxel faces as (axis, direction, u_axis, v_axis, pos_index,
+# neighbor_index, key_delta): pos_index picks the face plane out of a
+# (min_x, min_y, min_z, max_x, max_y, max_z) box, neighbor_index the touching
+# plane of the neighbor's box, and key_delta is added to a packed grid key to
+# get the key of the neighboring cell.
+_FACES = (
+    (0, 1, 1, 2, 3, 0, _KEY_STRIDES[0]),   # +X
+    (0, 0, 1, 2, 0, 3, -_KEY_STRIDES[0]),  # -X
+    (1, 1, 2, 0, 4, 1, _KEY_STRIDES[1]),   # +Y
+    (1, 0, 2, 0, 1, 4, -_KEY_STRIDES[1]),  # -Y
+    (2, 1, 0, 1, 5, 2, _KEY_STRIDES[2]),   # +Z
+    (2, 0, 0, 1, 2, 5, -_KEY_STRIDES[2]),  # -Z
+)
+
+# Swapping Y and Z for Z-up output is a reflection, which reverses the winding:
+# the quad (c0, c1, c2, c3) is emitted as (c0, c3, c2, c1).
+_WINDING_ZUP = {face: (w[0], w[3], w[2], w[1]) for face, w in _WINDING.items()}
+_QUAD_TRIANGLES_ZUP = {face: ((w[0], w[1], w[2]), (w[0], w[2], w[3])) for face, w in _WINDING_ZUP.items()}
+
+
+def _quad_triangles_y_up(normal, axis, direction, pos_on_axis, u_start, v_start, u_length, v_length):
+    """
+    Builds the 2 triangles of a rectangle for a given axis direction.
+
+    Returns:
+        tuple: Two (normal, v1, v2, v3) triangles, wound counter-clockwise
+    """
+    u_end = u_start + u_length
+    v_end = v_start + v_length
+
+    # Build 4 corners in (u, v) order (0, 0), (1, 0), (0, 1), (1, 1),
+    # placing u and v on the two axes perpendicular to the normal
+    if axis == 0:  # u = Y, v = Z
+        corners = ((pos_on_axis, u_start, v_start), (pos_on_axis, u_end, v_start),
+                   (pos_on_axis, u_start, v_end), (pos_on_axis, u_end, v_end))
+    elif axis == 1:  # u = Z, v = X
+        corners = ((v_start, pos_on_axis, u_start), (v_start, pos_on_axis, u_end),
+                   (v_end, pos_on_axis, u_start), (v_end, pos_on_axis, u_end))
+    else:  # u = X, v = Y
+        corners = ((u_start, v_start, pos_on_axis), (u_end, v_start, pos_on_axis),
+                   (u_start, v_end, pos_on_axis), (u_end, v_end, pos_on_axis))
+
+    # Split into CCW triangles with the template for this axis and direction
+    (a0, a1, a2), (b0, b1, b2) = _QUAD_TRIANGLES[axis, direction]
+    return ((normal, corners[a0], corners[a1], corners[a2]),
+            (normal, corners[b0], corners[b1], corners[b2]))
+
+
+def _quad_triangles_z_up(normal, axis, direction, pos_on_axis, u_start, v_start, u_length, v_length):
+    """
+    Z-up variant of _quad_triangles_y_up: the same rectangle given in internal
+    Y-up space, returned with Y/Z swapped for output and the winding corrected.
+
+    Returns:
+        tuple: Two (normal, v1, v2, v3) triangles, wound counter-clockwise
+    """
+    u_end = u_start + u_length
+    v_end = v_start + v_length
+
+    if axis == 0:  # u = Y (output Z), v = Z (output Y)
+        corners = ((pos_on_axis, v_start, u_start), (pos_on_axis, v_start, u_end),
+                   (pos_on_axis, v_end, u_start), (pos_on_axis, v_end, u_end))
+    elif axis == 1:  # u = Z (output Y), v = X
+        corners = ((v_start, u_start, pos_on_axis), (v_start, u_end, pos_on_axis),
+                   (v_end, u_start, pos_on_axis), (v_end, u_end, pos_on_axis))
+    else:  # u = X, v = Y (output Z)
+        corners = ((u_start, pos_on_axis, v_start), (u_end, pos_on_axis, v_start),
+                   (u_start, pos_on_axis, v_end), (u_end, pos_on_axis, v_end))
+
+    (a0, a1, a2), (b0, b1, b2) = _QUAD_TRIANGLES_ZUP[axis, direction]
+    return ((normal, corners[a0], corners[a1], corners[a2]),
+            (normal, corners[b0], corners[b1], corners[b2]))
+
+
+def _swap_yz(x, y, z):
+    """Converts between Z-up user coordinates and the internal Y-up space."""
+    return x, z, y
+
+
+def _keep_yz(x, y, z):
+    """Y-up counterpart of _swap_yz: user and internal coordinates coincide."""
+    return x, y, z
+
+
+def _clip_rectangle(x0, y0, x1, y1, nx0, ny0, nx1, ny1, eps):
+    """
+    Removes the part of rectangle (x0, y0)-(x1, y1) covered by rectangle
+    (nx0, ny0)-(nx1, ny1).
+
+    Returns:
+        list or None: Up to 4 rectangles (x0, y0, x1, y1) covering what is left,
+                      empty if the rectangle is fully covered, or None if the
+                      two do not overlap and the rectangle is left whole.
+    """
+    ix0 = max(x0, nx0)
+    ix1 = min(x1, nx1)
+    iy0 = max(y0, ny0)
+    iy1 = min(y1, ny1)
+    if ix1 <= ix0 + eps or iy1 <= iy0 + eps:
+        return None
+
+    rectangles = []
+    if ix0 > x0 + eps:
+        rectangles.append((x0, y0, ix0, y1))
+    if ix1 < x1 - eps:
+        rectangles.append((ix1, y0, x1, y1))
+    if iy0 > y0 + eps:
+        rectangles.append((ix0, y0, ix1, iy0))
+    if iy1 < y1 - eps:
+        rectangles.append((ix0, iy1, ix1, y1))
+    return rectangles
+
+
+class _PlaneFaces:
+    """
+    The face rectangles of voxel boxes lying in one plane, in grid units.
+
+    Single-cell faces, the common case, are kept by cell. Larger rectangles
+    are grouped by size: one at level k is at most 2**k cells on each side
+    and is filed under every 2**k-cell tile it touches, at most four. A query
+    probes the cells and tiles it overlaps, or scans a group when it holds
+    fewer rectangles than that, so lookups cost no more than the number of
+    rectangles in the plane however large the faces are.
+    """
+
+    __slots__ = ('cells', 'levels')
+
+    def __init__(self):
+        # (u, v) -> box for single-cell faces
+        self.cells = {}
+        # level -> (tiles dict mapping (tu, tv) to a list of entries, list of
+        # all entries at that level); an entry is (u0, v0, u1, v1, box)
+        self.levels = {}
+
+    def add(self, u0, v0, u1, v1, box):
+        """Files the face rectangle (u0, v0)-(u1, v1) of ``box``."""
+        if u1 - u0 == 1 and v1 - v0 == 1:
+            self.cells[u0, v0] = box
+            return
+        level = (max(u1 - u0, v1 - v0) - 1).bit_length()
+        filed = self.levels.get(level)
+        if filed is None:
+            filed = self.levels[level] = ({}, [])
+        tiles, entries = filed
+        entry = (u0, v0, u1, v1, box)
+        entries.append(entry)
+        for tu in range(u0 >> level, ((u1 - 1) >> level) + 1):
+            for tv in range(v0 >> level, ((v1 - 1) >> level) + 1):
+                tile = tiles.get((tu, tv))
+                if tile is None:
+                    tiles[tu, tv] = [entry]
+                else:
+                    tile.append(entry)
+
+    def overlapping(self, u0, v0, u1, v1):
+        """Returns the boxes whose rectangle overlaps (u0, v0)-(u1, v1)."""
+        found = []
+        cells = self.cells
+        if cells:
+            if u1 - u0 == 1 and v1 - v0 == 1:
+                box = cells.get((u0, v0))
+                if box is not None:
+                    found.append(box)
+            elif (u1 - u0) * (v1 - v0) > len(cells):
+                found.extend([box for (u, v), box in cells.items() if u0 <= u < u1 and v0 <= v < v1])
+            else:
+                found.extend([box for box in (cells.get((u, v)) for u in range(u0, u1) for v in range(v0, v1))
+                              if box is not None])
+        for level, (tiles, entries) in self.levels.items():
+            tu0, tu1 = u0 >> level, (u1 - 1) >> level
+            tv0, tv1 = v0 >> level, (v1 - 1) >> level
+            if (tu1 - tu0 + 1) * (tv1 - tv0 + 1) > len(entries):
+                candidates = entries
+            elif tu0 == tu1 and tv0 == tv1:
+                candidates = tiles.get((tu0, tv0), ())
+            else:
+                # A rectangle filed under several of the probed tiles is
+                # only taken once
+                candidates = {id(entry): entry for tu in range(tu0, tu1 + 1) for tv in range(tv0, tv1 + 1)
+                              for entry in tiles.get((tu, tv), ())}.values()
+            found.extend([box for nu0, nv0, nu1, nv1, box in candidates
+                          if nu0 < u1 and nu1 > u0 and nv0 < v1 and nv1 > v0])
+        return found
+
+
+def _index_face_planes(boxes):
+    """
+    Files the faces of every voxel box by the plane they lie in.
+
+    Only used with boxes in whole grid cells. A face of one voxel is touched
+    by another voxel exactly where the opposite face of that voxel lies in the
+    same plane and overlaps it, so querying the plane finds every touching
+    voxel, however many there are and wherever their keys lie.
+
+    Args:
+        boxes (dict): Voxel boxes in grid units, keyed by packed grid key.
+
+    Returns:
+        list: For each box index 0-5 (min X, Y, Z, then max X, Y, Z), a dict
+              mapping the grid position of a plane to the _PlaneFaces of the
+              box faces on that side lying in it.
+    """
+    face_planes = [{} for _ in range(6)]
+    sides = [(face_planes[side], side, (side + 1) % 3, (side + 2) % 3) for side in range(6)]
+    for box in boxes.values():
+        single_cell = box[3] - box[0] == 1 and box[4] - box[1] == 1 and box[5] - box[2] == 1
+        for planes, side, u_axis, v_axis in sides:
+            plane = planes.get(box[side])
+            if plane is None:
+                plane = planes[box[side]] = _PlaneFaces()
+            if single_cell:
+                plane.cells[box[u_axis], box[v_axis]] = box
+            else:
+                plane.add(box[u_axis], box[v_axis], box[u_axis + 3], box[v_axis + 3], box)
+    return face_planes
+
+
+def _subtract_rectangles(x0, y0, x1, y1, covers, eps):
+    """
+    Removes from rectangle (x0, y0)-(x1, y1) every rectangle in ``covers``.
+
+    Returns:
+        list or None: The remaining rectangles (empty if fully covered), or
+                      None if no cover overlaps the rectangle.
+    """
+    covers = [(nx0, ny0, nx1, ny1) for nx0, ny0, nx1, ny1 in covers
+              if nx1 > x0 and nx0 < x1 and ny1 > y0 and ny0 < y1]
+    if not covers:
+        return None
+    if not eps and len(covers) > _SWEEP_MIN_COVERS:
+        # Clipping by one cover at a time revisits every piece cut so far,
+        # which is quadratic in the number of covers
+        return _sweep_uncovered(x0, y0, x1, y1, covers)
+
+    pieces = [(x0, y0, x1, y1)]
+    for nx0, ny0, nx1, ny1 in covers:
+        remaining = []
+        for px0, py0, px1, py1 in pieces:
+            clipped = _clip_rectangle(px0, py0, px1, py1, nx0, ny0, nx1, ny1, eps)
+            if clipped is None:
+                remaining.append((px0, py0, px1, py1))
+            else:
+                remaining.extend(clipped)
+        pieces = remaining
+        if not pieces:
+            break
+    return pieces
+
+
+def _sweep_uncovered(x0, y0, x1, y1, covers):
+    """
+    Finds the parts of rectangle (x0, y0)-(x1, y1) outside every rectangle in
+    ``covers`` by sweeping along v, for exact coordinates.
+
+    The rectangle is cut into bands at the cover edges. In each band the
+    covers spanning it leave a few uncovered runs along u; a run that
+    continues unchanged into the next band extends the same rectangle.
+
+    Args:
+        covers (list): (u0, v0, u1, v1) rectangles, each overlapping the
+                       rectangle.
+
+    Returns:
+        list: The uncovered (u0, v0, u1, v1) rectangles.
+    """
+    edges = sorted({y0, y1}.union(v for _, ny0, _, ny1 in covers for v in (ny0, ny1) if y0 < v < y1))
+    pending = sorted(covers, key=itemgetter(1), reverse=True)
+    active = []
+    # Uncovered (u0, u1) runs of the previous band -> v where each started
+    open_runs = {}
+    rectangles = []
+    for band_start in edges[:-1]:
+        while pending and pending[-1][1] <= band_start:
+            active.append(pending.pop())
+        active = [cover for cover in active if cover[3] > band_start]
+        active.sort()
+
+        runs = {}
+        u = x0
+        for nx0, _, nx1, _ in active:
+            if nx0 > u:
+                runs[u, nx0] = open_runs.pop((u, nx0), band_start)
+            if nx1 > u:
+                u = nx1
+        if u < x1:
+            runs[u, x1] = open_runs.pop((u, x1), band_start)
+
+        # Runs that did not continue into this band end at its start
+        rectangles.extend([(u0, v0, u1, band_start) for (u0, u1), v0 in open_runs.items()])
+        open_runs = runs
+    rectangles.extend([(u0, v0, u1, y1) for (u0, u1), v0 in open_runs.items()])
+    return rectangles
+
+
+class _FlatTriangles:
+    """
+    Collects triangles straight into flat float32 buffers.
+
+    Has the ``append``/``len`` interface of a triangle list, so generate_mesh
+    can mesh into it without ever holding the whole list of triangle tuples.
+    ``normals`` receives 3 floats and ``vertices`` 9 floats per triangle.
+    """
+
+    __slots__ = ('normals', 'vertices')
+
+    def __init__(self):
+        self.normals = array('f')
+        self.vertices = array('f')
+
+    def append(self, triangle):
+        normal, v1, v2, v3 = triangle
+        self.normals.extend(normal)
+        self.vertices.extend((*v1, *v2, *v3))
+
+    def __len__(self):
+        return len(self.normals) // 3
+
+
+class _OccupancyGrid:
+    """
+    Dense occupancy bitsets of a fixed grid box, one per normal axis.
+
+    Each bitset has one bit per grid cell, laid out so that u varies fastest,
+    then v, then the slice index along the normal, with every row rounded up
+    to whole bytes. This is the layout _collect_faces_dense shifts and scans.
+    The model keeps the bits in step with its voxels as they are added and
+    removed, so meshing does not have to rebuild them from the voxel dict.
+    """
+
+    __slots__ = ('mins', 'sizes', 'layouts', 'bits')
+
+    def __init__(self, mins, sizes, layouts):
+        self.mins = mins
+        self.sizes = sizes
+        # Per normal axis: (u_axis, v_axis, row_bytes, slice_bits, origin),
+        # where origin makes the bit index of the box's min corner zero
+        self.layouts = layouts
+        self.bits = [bytearray(layout[3] * sizes[axis] // 8) for axis, layout in enumerate(layouts)]
+
+    def reset(self):
+        """Clears every cell, keeping the grid box."""
+        self.bits = [bytearray(len(bits)) for bits in self.bits]
+
+    def mark(self, gx, gy, gz, filled):
+        """
+        Sets or clears the bits of one grid cell.
+
+        Returns:
+            bool: False, with nothing changed, if the cell is outside the box.
+        """
+        coord = (gx, gy, gz)
+        for axis in range(3):
+            if not 0 <= coord[axis] - self.mins[axis] < self.sizes[axis]:
+                return False
+        for axis, (u_axis, v_axis, row_bytes, slice_bits, origin) in enumerate(self.layouts):
+            idx = origin + coord[u_axis] + coord[v_axis] * row_bytes * 8 + coord[axis] * slice_bits
+            if filled:
+                self.bits[axis][idx >> 3] |= 1 << (idx & 7)
+            else:
+                self.bits[axis][idx >> 3] &= ~(1 << (idx & 7))
+        return True
+
+
+def _empty_occupancy_grid(mins, sizes):
+    """
+    Creates an empty occupancy grid of a grid box.
+
+    Args:
+        mins (tuple): Minimum grid index of the box along each internal axis.
+        sizes (tuple): Number of grid cells of the box along each internal axis.
+
+    Returns:
+        _OccupancyGrid or None: The grid, or None if the box is too large for a
+                                dense grid.
+    """
+    layouts = []
+    for axis in range(3):
+        u_axis = (axis + 1) % 3
+        v_axis = (axis + 2) % 3
+        row_bytes = (sizes[u_axis] + 7) // 8
+        slice_bits = row_bytes * 8 * sizes[v_axis]
+        if slice_bits * sizes[axis] > _DENSE_GRID_MAX_CELLS:
+            return None
+        origin = -(mins[u_axis] + mins[v_axis] * row_bytes * 8 + mins[axis] * slice_bits)
+        layouts.append((u_axis, v_axis, row_bytes, slice_bits, origin))
+    return _OccupancyGrid(mins, sizes, layouts)
+
+
+def _build_occupancy_grid(keys):
+    """
+    Builds the occupancy grid of the bounding box of the given voxel keys.
+
+    Returns:
+        _OccupancyGrid or None: The filled grid, or None if the bounding box is
+                                too large for a dense grid.
+    """
+    coords = [_unpack_grid_key(key) for key in keys]
+    mins = tuple(min(c[i] for c in coords) for i in range(3))
+    sizes = tuple(max(c[i] for c in coords) - mins[i] + 1 for i in range(3))
+
+    grid = _empty_occupancy_grid(mins, sizes)
+    if grid is None:
+        return None
+    for axis, (u_axis, v_axis, row_bytes, slice_bits, origin) in enumerate(grid.layouts):
+        bits = grid.bits[axis]
+        row_bits = row_bytes * 8
+        for c in coords:
+            idx = origin + c[u_axis] + c[v_axis] * row_bits + c[axis] * slice_bits
+            bits[idx >> 3] |= 1 << (idx & 7)
+    return grid
+
 
 class VoxelModel:
     """
@@ -17,7 +568,23 @@ class VoxelModel:
     the resulting shape using various mesh writers. Logging messages are emitted
     via the standard 'logging' module; configuration is up to the application.
     """
-    def __init__(self, voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='y_up'):
+    __slots__ = (
+        '_voxel_dimensions',
+        '_voxels',
+        '_nonuniform_count',
+        '_occupancy',
+        '_mesh_cache',
+        '_coordinate_system',
+        '_anchor_offsets',
+        '_grid_dims',
+        '_normals',
+        '_swap_yz_if_needed',
+        '_build_quad_triangles',
+        '_dimension_snap_warning_emitted',
+        '_grid_align_warning_emitted',
+    )
+
+    def __init__(self, voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='y_up', bbox=None):
         """
         Initializes the VoxelModel.
 
@@ -30,29 +597,88 @@ class VoxelModel:
                                     orientation in most slicers.
                                     - 'y_up': Y axis is vertical (mathematical convention)
                                     - 'z_up': Z axis is vertical (3D printing convention)
+            bbox (tuple, optional): Expected extent of the model as a number of
+                                    voxels (nx, ny, nz) along each axis, counted
+                                    from the grid cell at the origin. When given,
+                                    the occupancy bitsets used for meshing are
+                                    allocated up front and filled as voxels are
+                                    added. Voxels outside the box are still
+                                    allowed; the bitsets are then rebuilt for
+                                    the actual extent when the mesh is generated.
         """
-        if not (isinstance(voxel_dimensions, (tuple, list)) and
-                len(voxel_dimensions) == 3 and
-                all(isinstance(dim, (int, float)) and dim > 0 for dim in voxel_dimensions)):
-            raise ValueError("voxel_dimensions must be a tuple or list of three positive numbers.")
         if coordinate_system not in ('y_up', 'z_up'):
             raise ValueError("coordinate_system must be either 'y_up' or 'z_up'.")
+        if bbox is not None and not (isinstance(bbox, (tuple, list)) and
+                                     len(bbox) == 3 and
+                                     all(isinstance(n, int) and n > 0 for n in bbox)):
+            raise ValueError("bbox must be a tuple or list of three positive integers.")
 
-        self.voxel_dimensions = tuple(float(dim) for dim in voxel_dimensions)
         # Stores voxel data as a dictionary:
-        # key: integer grid coordinate (ix, iy, iz)
+        # key: integer grid coordinate (ix, iy, iz), packed by _pack_grid_coord
         # value: tuple of dimensions (width, height, depth) for that voxel
         self._voxels = {}
+        # Number of stored voxels whose dimensions differ from the grid spacing,
+        # maintained on every mutation so the greedy-meshing check is O(1)
+        self._nonuniform_count = 0
+        # Dense occupancy bitsets of the voxels, allocated from bbox or built when
+        # first meshed and then updated in place; None until built, or once a
+        # voxel leaves its box
+        self._occupancy = None
+        # Triangle tuples from generate_mesh keyed by the optimize flag, dropped
+        # whenever the voxels change
+        self._mesh_cache = {}
         # Coordinate system: 'y_up' (default) or 'z_up'
         self._coordinate_system = coordinate_system
+        self._anchor_offsets = _ANCHOR_OFFSETS[coordinate_system]
+        # Install the coordinate-system specific helpers once, so the hot
+        # paths never test the coordinate system themselves.
+        if coordinate_system == 'z_up':
+            self._swap_yz_if_needed = _swap_yz
+            self._build_quad_triangles = _quad_triangles_z_up
+            self._normals = _NORMALS_ZUP
+        else:
+            self._swap_yz_if_needed = _keep_yz
+            self._build_quad_triangles = _quad_triangles_y_up
+            self._normals = _NORMALS
+        # Validated and stored together with the internal grid spacing
+        self.voxel_dimensions = voxel_dimensions
+        if bbox is not None:
+            self._occupancy = _empty_occupancy_grid((0, 0, 0), self._swap_yz_if_needed(*bbox))
         self._dimension_snap_warning_emitted = False
+        self._grid_align_warning_emitted = False
         logger.info(f"VoxelModel initialized with default voxel_dimensions={self.voxel_dimensions}, coordinate_system={coordinate_system}")
 
-    def _swap_yz_if_needed(self, x, y, z):
-        """Helper method to swap Y and Z coordinates when in Z-up mode."""
-        if self._coordinate_system == 'z_up':
-            return x, z, y
-        return x, y, z
+    @property
+    def voxel_dimensions(self):
+        """
+        tuple: The default (x_size, y_size, z_size) of each voxel, which is
+        also the grid spacing voxels snap to. Always in (x, y, z) order
+        regardless of coordinate system.
+
+        Voxels already in the model keep their grid cells and their own
+        dimensions when new default dimensions are assigned, so they are
+        placed on the new grid spacing.
+
+        Raises:
+            ValueError: If assigned anything but three positive numbers.
+        """
+        return self._voxel_dimensions
+
+    @voxel_dimensions.setter
+    def voxel_dimensions(self, voxel_dimensions):
+        if not (isinstance(voxel_dimensions, (tuple, list)) and
+                len(voxel_dimensions) == 3 and
+                all(isinstance(dim, (int, float)) and dim > 0 for dim in voxel_dimensions)):
+            raise ValueError("voxel_dimensions must be a tuple or list of three positive numbers.")
+        self._voxel_dimensions = tuple(float(dim) for dim in voxel_dimensions)
+        # Grid spacing in the internal Y-up representation, kept here rather
+        # than derived on every use
+        grid_dims = self._swap_yz_if_needed(*self._voxel_dimensions)
+        self._grid_dims = grid_dims
+        # Which voxels count as non-uniform, and every cached mesh, depend on
+        # the spacing
+        self._nonuniform_count = sum(1 for dims in self._voxels.values() if dims != grid_dims)
+        self._mesh_cache.clear()
 
     def _calculate_min_corner(self, x, y, z, anchor, dimensions):
         """
@@ -73,31 +699,50 @@ class VoxelModel:
         Raises:
             ValueError: If an invalid anchor point is provided.
         """
+        try:
+            offset_x, offset_y, offset_z = self._anchor_offsets[anchor]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid anchor point: {anchor}") from None
+
         size_x, size_y, size_z = dimensions
-        half_x, half_y, half_z = size_x / 2.0, size_y / 2.0, size_z / 2.0
-
-        if anchor == CubeAnchor.CORNER_NEG:
-            min_x, min_y, min_z = x, y, z
-        elif anchor == CubeAnchor.CENTER:
-            min_x, min_y, min_z = x - half_x, y - half_y, z - half_z
-        elif anchor == CubeAnchor.CORNER_POS:
-            min_x, min_y, min_z = x - size_x, y - size_y, z - size_z
-        elif anchor == CubeAnchor.BOTTOM_CENTER:
-            # In Y-up: center of min Y face; In Z-up: center of min Z face
-            if self._coordinate_system == 'z_up':
-                min_x, min_y, min_z = x - half_x, y - half_y, z
-            else:
-                min_x, min_y, min_z = x - half_x, y, z - half_z
-        elif anchor == CubeAnchor.TOP_CENTER:
-            # In Y-up: center of max Y face; In Z-up: center of max Z face
-            if self._coordinate_system == 'z_up':
-                min_x, min_y, min_z = x - half_x, y - half_y, z - size_z
-            else:
-                min_x, min_y, min_z = x - half_x, y - size_y, z - half_z
-        else:
-            raise ValueError(f"Invalid anchor point: {anchor}")
+        return x - offset_x * size_x, y - offset_y * size_y, z - offset_z * size_z
 
-        return min_x, min_y, min_z
+    def _resolve_dimensions(self, dimensions):
+        """
+        Validates custom voxel dimensions and converts them to the internal Y-up
+        representation, snapped to the grid spacing.
+
+        Args:
+            dimensions (tuple, optional): Custom dimensions (x_size, y_size, z_size),
+                                          or None to use the model's defaults.
+
+        Returns:
+            tuple: The (width, height, depth) to store for the voxel.
+
+        Raises:
+            ValueError: If the custom dimensions are invalid.
+        """
+        if dimensions is None:
+            return self._voxel_dimensions
+
+        voxel_dims = tuple(float(d) for d in dimensions)
+        if not (isinstance(voxel_dims, (tuple, list)) and
+                len(voxel_dims) == 3 and
+                all(isinstance(d, (int, float)) and d > 0 for d in voxel_dims)):
+            raise ValueError("Custom dimensions must be a tuple or list of three positive numbers.")
+        # Swap custom dimensions if in Z-up mode to convert to internal Y-up representation
+        voxel_dims = self._swap_yz_if_needed(*voxel_dims)
+        voxel_dims, snapped = self._snap_dimensions(voxel_dims)
+        if snapped and not self._dimension_snap_warning_emitted:
+            grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dims
+            logger.warning(
+                "Custom voxel dimensions snapped to grid spacing (%.6f, %.6f, %.6f).",
+                grid_dim_x,
+                grid_dim_y,
+                grid_dim_z
+            )
+            self._dimension_snap_warning_emitted = True
+        return voxel_dims
 
     def add_voxel(self, x, y, z, anchor=CubeAnchor.CORNER_NEG, dimensions=None):
         """
@@ -116,32 +761,16 @@ class VoxelModel:
                                           Always in (x, y, z) order regardless of coordinate system.
                                           Dimensions are snapped to the model's voxel grid spacing.
                                           If None, the model's default dimensions are used.
+
+        Raises:
+            ValueError: If the dimensions are invalid, or the voxel's grid
+                        position is more than 1,048,574 grid cells from the
+                        origin along any axis.
         """
         # Swap coordinates if in Z-up mode
         x, y, z = self._swap_yz_if_needed(x, y, z)
 
-        # Get dimensions and validate
-        if dimensions is None:
-            voxel_dims = self.voxel_dimensions
-        else:
-            voxel_dims = tuple(float(d) for d in dimensions)
-            if not (isinstance(voxel_dims, (tuple, list)) and
-                    len(voxel_dims) == 3 and
-                    all(isinstance(d, (int, float)) and d > 0 for d in voxel_dims)):
-                raise ValueError("Custom dimensions must be a tuple or list of three positive numbers.")
-            # Swap custom dimensions if in Z-up mode to convert to internal Y-up representation
-            if self._coordinate_system == 'z_up':
-                voxel_dims = (voxel_dims[0], voxel_dims[2], voxel_dims[1])
-            voxel_dims, snapped = self._snap_dimensions(voxel_dims)
-            if snapped and not self._dimension_snap_warning_emitted:
-                grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dimensions()
-                logger.warning(
-                    "Custom voxel dimensions snapped to grid spacing (%.6f, %.6f, %.6f).",
-                    grid_dim_x,
-                    grid_dim_y,
-                    grid_dim_z
-                )
-                self._dimension_snap_warning_emitted = True
+        voxel_dims = self._resolve_dimensions(dimensions)
 
         min_x, min_y, min_z = self._calculate_min_corner(x, y, z, anchor, voxel_dims)
 
@@ -149,9 +778,7 @@ class VoxelModel:
         # This ensures voxels snap to a consistent grid.
         # In Z-up mode, we need to use swapped dimensions for grid calculation
         # because internally we work in Y-up space
-        grid_dim_x, grid_dim_y, grid_dim_z = self.voxel_dimensions
-        if self._coordinate_system == 'z_up':
-            grid_dim_y, grid_dim_z = grid_dim_z, grid_dim_y
+        grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dims
 
         raw_x = min_x / grid_dim_x
         raw_y = min_y / grid_dim_y
@@ -159,17 +786,34 @@ class VoxelModel:
         grid_x = round(raw_x)
         grid_y = round(raw_y)
         grid_z = round(raw_z)
-        # Warn if rounding actually occurred (i.e., not exactly on grid)
-        if (grid_x != raw_x) or (grid_y != raw_y) or (grid_z != raw_z):
-            logger.warning(
-                f"Voxel at ({x}, {y}, {z}) with anchor {anchor} and dimensions {voxel_dims} "
-                f"does not align exactly to grid; rounded from ({raw_x:.6f}, {raw_y:.6f}, {raw_z:.6f}) "
-                f"to ({grid_x}, {grid_y}, {grid_z})"
-            )
-
-        grid_coord = (grid_x, grid_y, grid_z)
-        self._voxels[grid_coord] = voxel_dims
-        # logger.debug(f"Added voxel at grid {grid_coord} (from anchor {anchor} at ({x},{y},{z}))")
+        # Warn (once per model) if rounding actually occurred (i.e., not exactly on grid)
+        if ((grid_x != raw_x) or (grid_y != raw_y) or (grid_z != raw_z)) and \
+                not self._grid_align_warning_emitted:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Voxel at (%s, %s, %s) with anchor %s and dimensions %s does not align exactly "
+                    "to grid; rounded from (%.6f, %.6f, %.6f) to (%d, %d, %d). "
+                    "Further misaligned voxels will be rounded without warning.",
+                    x, y, z, anchor, voxel_dims,
+                    raw_x, raw_y, raw_z,
+                    grid_x, grid_y, grid_z
+                )
+            self._grid_align_warning_emitted = True
+
+        key = _pack_grid_coord(grid_x, grid_y, grid_z)
+        previous_dims = self._voxels.get(key)
+        if previous_dims is not None and previous_dims != self._grid_dims:
+            self._nonuniform_count -= 1
+        if voxel_dims != self._grid_dims:
+            self._nonuniform_count += 1
+        self._voxels[key] = voxel_dims
+        if previous_dims != voxel_dims:
+            # Re-adding an identical voxel leaves the cached meshes valid
+            self._mesh_cache.clear()
+        if self._occupancy is not None and not self._occupancy.mark(grid_x, grid_y, grid_z, True):
+            # Outside the grid box: rebuild the grid at the next mesh
+            self._occupancy = None
+        # logger.debug(f"Added voxel at grid {(grid_x, grid_y, grid_z)} (from anchor {anchor} at ({x},{y},{z}))")
 
     # Alias add_cube to add_voxel for backward compatibility (optional, but can be helpful)
     add_cube = add_voxel
@@ -178,25 +822,167 @@ class VoxelModel:
         """
         Adds multiple voxels from an iterable. Replaces add_cubes.
 
+        Dimension validation, anchor handling and grid lookup are resolved once
+        for the whole batch, so this is considerably faster than calling
+        add_voxel for each coordinate.
+
         Args:
             coordinates (iterable): An iterable of (x, y, z) tuples or lists.
             anchor (CubeAnchor): The anchor point to use for all voxels added
                                 in this call.
-            dimensions (tuple, optional): The dimensions to apply to all voxels
-                                          in this call. Dimensions are snapped
+            dimensions (iterable, optional): The dimensions to apply to all
+                                          voxels in this call, or an iterable
+                                          with one (x_size, y_size, z_size)
+                                          per coordinate. Dimensions are snapped
                                           to the model's voxel grid spacing.
                                           If None, defaults are used.
+
+        Raises:
+            ValueError: If the dimensions are invalid, a list of per-voxel
+                        dimensions does not match the coordinates in length,
+                        or a voxel's grid position is more than 1,048,574 grid
+                        cells from the origin along any axis.
         """
-        for x_coord, y_coord, z_coord in coordinates:
-            self.add_voxel(x_coord, y_coord, z_coord, anchor, dimensions)
+        if dimensions is not None:
+            # Accept any iterable. Per-voxel dimensions (and an empty list) hold
+            # one size per coordinate, so their items are iterable themselves;
+            # shared dimensions are three numbers of any numeric type.
+            dimensions = list(dimensions)
+            if not dimensions or hasattr(dimensions[0], '__iter__'):
+                self._add_voxels_with_dimensions(coordinates, anchor, dimensions)
+                return
+
+        # Everything that does not depend on the individual coordinates is
+        # resolved once per call instead of once per voxel.
+        voxel_dims = self._resolve_dimensions(dimensions)
+        # The min corner is a fixed offset from the anchor point for a given
+        # anchor and size, so compute that offset once.
+        offset_x, offset_y, offset_z = self._calculate_min_corner(0.0, 0.0, 0.0, anchor, voxel_dims)
+        grid_dims = self._grid_dims
+        grid_dim_x, grid_dim_y, grid_dim_z = grid_dims
+        swap_yz = self._swap_yz_if_needed
+
+        grid_keys = []
+        append = grid_keys.append
+        misaligned = 0
+        for x, y, z in coordinates:
+            x, y, z = swap_yz(x, y, z)
+            raw_x = (x + offset_x) / grid_dim_x
+            raw_y = (y + offset_y) / grid_dim_y
+            raw_z = (z + offset_z) / grid_dim_z
+            grid_x = round(raw_x)
+            grid_y = round(raw_y)
+            grid_z = round(raw_z)
+            if (grid_x != raw_x) or (grid_y != raw_y) or (grid_z != raw_z):
+                misaligned += 1
+            append(_pack_grid_coord(grid_x, grid_y, grid_z))
+
+        # Emit a single aggregated warning rather than one per voxel
+        if misaligned:
+            logger.warning(
+                "%d of %d voxels with anchor %s and dimensions %s do not align exactly to grid; "
+                "rounded to the nearest grid position.",
+                misaligned,
+                len(grid_keys),
+                anchor,
+                voxel_dims
+            )
+
+        new_voxels = dict.fromkeys(grid_keys, voxel_dims)
+        self._store_voxels(new_voxels, len(new_voxels) if voxel_dims != grid_dims else 0)
 
     # Alias add_cubes to add_voxels
     add_cubes = add_voxels
 
+    def _add_voxels_with_dimensions(self, coordinates, anchor, dimensions):
+        """
+        Variant of add_voxels for a list of per-voxel dimensions.
+
+        Each distinct size is validated, snapped and turned into an anchor
+        offset only once, however many voxels share it.
+        """
+        coordinates = list(coordinates)
+        if len(dimensions) != len(coordinates):
+            raise ValueError(
+                f"Got {len(dimensions)} per-voxel dimensions for {len(coordinates)} coordinates; "
+                "expected one (x_size, y_size, z_size) per coordinate."
+            )
+        grid_dims = self._grid_dims
+        grid_dim_x, grid_dim_y, grid_dim_z = grid_dims
+        swap_yz = self._swap_yz_if_needed
+
+        # Raw dimensions -> (stored dimensions, min corner offset from anchor)
+        resolved = {}
+        new_voxels = {}
+        misaligned = 0
+        for (x, y, z), dims in zip(coordinates, dimensions):
+            dims = tuple(dims)
+            entry = resolved.get(dims)
+            if entry is None:
+                voxel_dims = self._resolve_dimensions(dims)
+                entry = resolved[dims] = (
+                    voxel_dims, self._calculate_min_corner(0.0, 0.0, 0.0, anchor, voxel_dims))
+            voxel_dims, (offset_x, offset_y, offset_z) = entry
+            x, y, z = swap_yz(x, y, z)
+            raw_x = (x + offset_x) / grid_dim_x
+            raw_y = (y + offset_y) / grid_dim_y
+            raw_z = (z + offset_z) / grid_dim_z
+            grid_x = round(raw_x)
+            grid_y = round(raw_y)
+            grid_z = round(raw_z)
+            if (grid_x != raw_x) or (grid_y != raw_y) or (grid_z != raw_z):
+                misaligned += 1
+            new_voxels[_pack_grid_coord(grid_x, grid_y, grid_z)] = voxel_dims
+
+        if misaligned:
+            logger.warning(
+                "%d of %d voxels with anchor %s and per-voxel dimensions do not align exactly to grid; "
+                "rounded to the nearest grid position.",
+                misaligned,
+                len(coordinates),
+                anchor
+            )
+
+        self._store_voxels(new_voxels, sum(1 for dims in new_voxels.values() if dims != grid_dims))
+
+    def _store_voxels(self, new_voxels, nonuniform):
+        """
+        Stores a batch of voxels, keeping the non-uniform count, mesh cache and
+        occupancy grid in step.
+
+        Args:
+            new_voxels (dict): Packed grid key -> stored dimensions.
+            nonuniform (int): How many of the new voxels are non-uniform.
+        """
+        if self._nonuniform_count:
+            # Non-uniform voxels being replaced no longer count
+            voxels = self._voxels
+            grid_dims = self._grid_dims
+            self._nonuniform_count -= sum(
+                1 for key in new_voxels if voxels.get(key, grid_dims) != grid_dims
+            )
+        self._nonuniform_count += nonuniform
+        if self._mesh_cache:
+            # Keep the cached meshes if every voxel was already stored as is
+            voxels = self._voxels
+            if any(voxels.get(key) != dims for key, dims in new_voxels.items()):
+                self._mesh_cache.clear()
+        self._voxels.update(new_voxels)
+
+        occupancy = self._occupancy
+        if occupancy is not None:
+            for key in new_voxels:
+                if not occupancy.mark(*_unpack_grid_key(key), True):
+                    self._occupancy = None
+                    break
+
     def remove_voxel(self, x, y, z, anchor=CubeAnchor.CORNER_NEG):
         """
         Removes a voxel from the model based on its anchor coordinates. Replaces remove_cube.
 
+        Positions outside the supported grid range hold no voxel, so removing
+        one does nothing.
+
         Args:
             x (float): X-coordinate of the voxel's anchor point.
             y (float): Y-coordinate of the voxel's anchor point (Y-up mode) or
@@ -211,26 +997,36 @@ class VoxelModel:
 
         # Note: Removal does not need custom dimensions, as it identifies the
         # voxel by its position on the grid, which is calculated using default dimensions.
-        min_x, min_y, min_z = self._calculate_min_corner(x, y, z, anchor, self.voxel_dimensions)
+        min_x, min_y, min_z = self._calculate_min_corner(x, y, z, anchor, self._voxel_dimensions)
 
-        raw_x = min_x / self.voxel_dimensions[0]
-        raw_y = min_y / self.voxel_dimensions[1]
-        raw_z = min_z / self.voxel_dimensions[2]
+        raw_x = min_x / self._voxel_dimensions[0]
+        raw_y = min_y / self._voxel_dimensions[1]
+        raw_z = min_z / self._voxel_dimensions[2]
         grid_x = round(raw_x)
         grid_y = round(raw_y)
         grid_z = round(raw_z)
         if (grid_x != raw_x) or (grid_y != raw_y) or (grid_z != raw_z):
             logger.warning(
-                f"Voxel removal at ({x}, {y}, {z}) with anchor {anchor} "
-                f"does not align exactly to grid; rounded from "
-                f"({raw_x:.6f}, {raw_y:.6f}, {raw_z:.6f}) to "
-                f"({grid_x}, {grid_y}, {grid_z})"
+                "Voxel removal at (%s, %s, %s) with anchor %s does not align exactly to grid; "
+                "rounded from (%.6f, %.6f, %.6f) to (%d, %d, %d)",
+                x, y, z, anchor,
+                raw_x, raw_y, raw_z,
+                grid_x, grid_y, grid_z
             )
 
-        grid_coord = (grid_x, grid_y, grid_z)
-        if grid_coord in self._voxels:
-            del self._voxels[grid_coord]
-        # logger.debug(f"Attempted removal at grid {grid_coord}")
+        try:
+            key = _pack_grid_coord(grid_x, grid_y, grid_z)
+        except ValueError:
+            # Outside the supported grid range, so no voxel can be stored there
+            return
+        removed_dims = self._voxels.pop(key, None)
+        if removed_dims is not None and removed_dims != self._grid_dims:
+            self._nonuniform_count -= 1
+        if removed_dims is not None:
+            self._mesh_cache.clear()
+            if self._occupancy is not None:
+                self._occupancy.mark(grid_x, grid_y, grid_z, False)
+        # logger.debug(f"Attempted removal at grid {(grid_x, grid_y, grid_z)}")
 
     # Alias remove_cube to remove_voxel
     remove_cube = remove_voxel
@@ -238,14 +1034,12 @@ class VoxelModel:
     def clear(self):
         """Removes all voxels from the model."""
         self._voxels.clear()
+        self._nonuniform_count = 0
+        if self._occupancy is not None:
+            self._occupancy.reset()
+        self._mesh_cache.clear()
         logger.info("VoxelModel cleared.")
 
-    def _grid_dimensions(self):
-        grid_dim_x, grid_dim_y, grid_dim_z = self.voxel_dimensions
-        if self._coordinate_system == 'z_up':
-            grid_dim_y, grid_dim_z = grid_dim_z, grid_dim_y
-        return grid_dim_x, grid_dim_y, grid_dim_z
-
     def _snap_to_grid(self, value, grid_dim, eps=1e-9):
         layers = int(round(value / grid_dim))
         if layers < 1:
@@ -254,7 +1048,7 @@ class VoxelModel:
         return snapped, abs(snapped - value) > eps
 
     def _snap_dimensions(self, dimensions):
-        grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dimensions()
+        grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dims
         snapped_dims = []
         changed = False
         for value, grid_dim in zip(dimensions, (grid_dim_x, grid_dim_y, grid_dim_z)):
@@ -263,26 +1057,64 @@ class VoxelModel:
             changed = changed or did_change
         return tuple(snapped_dims), changed
 
-    def _voxel_min_corner(self, grid_coord):
-        grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dimensions()
-        gx, gy, gz = grid_coord
-        return gx * grid_dim_x, gy * grid_dim_y, gz * grid_dim_z
+    def _voxel_boxes(self, eps=1e-9):
+        """
+        Computes the bounding box of every voxel for partial adjacency meshing.
+
+        Each box is a 12-tuple keyed by packed grid key: the comparison box
+        (min_x, min_y, min_z, max_x, max_y, max_z) followed by the same box in
+        world units. The comparison box is in whole grid cells when every voxel
+        spans a whole number of cells, so planes and overlaps compare exactly;
+        otherwise it is the world box itself and comparisons need a tolerance.
+
+        Returns:
+            tuple: (boxes, eps, scales) where eps is the comparison tolerance
+                   and scales converts comparison units to world units per axis.
+        """
+        grid_dims = self._grid_dims
+        grid_dim_x, grid_dim_y, grid_dim_z = grid_dims
+        unpack = _unpack_grid_key
+        boxes = {}
+        # Models use few distinct voxel sizes, so convert each size to grid
+        # cells once; None marks a size that is not a whole number of cells
+        layers_by_dims = {}
+        for key, dims in self._voxels.items():
+            if dims not in layers_by_dims:
+                layers = tuple(round(size / grid_dim) for size, grid_dim in zip(dims, grid_dims))
+                if any(abs(count * grid_dim - size) > eps
+                       for count, size, grid_dim in zip(layers, dims, grid_dims)):
+                    layers = None
+                layers_by_dims[dims] = layers
+            layers = layers_by_dims[dims]
+            if layers is None:
+                break
+            layers_x, layers_y, layers_z = layers
+            # Box extents are plain grid indices and are never packed into
+            # keys, so a large voxel near the edge of the key range cannot
+            # alias another cell
+            gx, gy, gz = unpack(key)
+            max_gx = gx + layers_x
+            max_gy = gy + layers_y
+            max_gz = gz + layers_z
+            boxes[key] = (gx, gy, gz, max_gx, max_gy, max_gz,
+                          gx * grid_dim_x, gy * grid_dim_y, gz * grid_dim_z,
+                          max_gx * grid_dim_x, max_gy * grid_dim_y, max_gz * grid_dim_z)
+        else:
+            return boxes, 0, grid_dims
+
+        for key, (size_x, size_y, size_z) in self._voxels.items():
+            gx, gy, gz = unpack(key)
+            box = (gx * grid_dim_x, gy * grid_dim_y, gz * grid_dim_z)
+            box += (box[0] + size_x, box[1] + size_y, box[2] + size_z)
+            boxes[key] = box + box
+        return boxes, eps, (1.0, 1.0, 1.0)
 
     def _can_use_greedy_meshing(self):
-        if not self._voxels:
-            return False
-        default_dims = self._grid_dimensions()
-        return all(dims == default_dims for dims in self._voxels.values())
+        return bool(self._voxels) and self._nonuniform_count == 0
 
     def _append_face_rectangles(self, triangles, axis, direction, pos_on_axis, rectangles):
-        normal = [0, 0, 0]
-        normal[axis] = 1 if direction == 1 else -1
-        normal = tuple(normal)
-
-        output_normal = normal
-        swap_output = self._coordinate_system == 'z_up'
-        if swap_output:
-            output_normal = (normal[0], normal[2], normal[1])
+        output_normal = self._normals[axis, direction]
+        build_quad_triangles = self._build_quad_triangles
 
         for u0, v0, u1, v1 in rectangles:
             u_length = u1 - u0
@@ -290,23 +1122,52 @@ class VoxelModel:
             if u_length <= 0 or v_length <= 0:
                 continue
 
-            verts = self._build_rect_vertices(axis, direction, pos_on_axis,
-                                              u0, v0, u_length, v_length)
-            if swap_output:
-                verts = [(v[0], v[2], v[1]) for v in verts]
-                triangles.append((output_normal, verts[0], verts[2], verts[1]))
-                triangles.append((output_normal, verts[0], verts[3], verts[2]))
-            else:
-                triangles.append((output_normal, verts[0], verts[1], verts[2]))
-                triangles.append((output_normal, verts[0], verts[2], verts[3]))
+            first, second = build_quad_triangles(output_normal, axis, direction, pos_on_axis,
+                                                 u0, v0, u_length, v_length)
+            triangles.append(first)
+            triangles.append(second)
 
-    def _heightmap_mesh(self, optimize=False):
-        grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dimensions()
+    def _append_all_face_rectangles(self, triangles, batches):
+        """
+        Appends the triangles for batches of face rectangles.
+
+        Args:
+            triangles (list): The output triangle list to append to.
+            batches (list): (axis, direction, rectangles) tuples, where each
+                            rectangle is (pos_on_axis, u0, v0, u1, v1).
+        """
+        append = triangles.append
+        build_quad_triangles = self._build_quad_triangles
+
+        for axis, direction, rectangles in batches:
+            normal = self._normals[axis, direction]
+            for pos_on_axis, u0, v0, u1, v1 in rectangles:
+                u_length = u1 - u0
+                v_length = v1 - v0
+                if u_length <= 0 or v_length <= 0:
+                    continue
+
+                first, second = build_quad_triangles(normal, axis, direction, pos_on_axis,
+                                                     u0, v0, u_length, v_length)
+                append(first)
+                append(second)
+
+    def _heightmap_mesh(self, triangles, optimize=False):
+        grid_dim_x, grid_dim_y, grid_dim_z = self._grid_dims
         eps = 1e-9
 
+        # Single pass: validate the heightmap layout and quantize each column
+        # height to whole layers of the grid spacing as it is read. All voxels
+        # share one grid Y, so a voxel's packed key identifies its column and
+        # neighboring columns are one X or Z key stride away.
         heights = {}
+        column_layers = {}
+        unique_heights = {0.0}
+        snapped = False
         base_gy = None
-        for (gx, gy, gz), (size_x, size_y, size_z) in self._voxels.items():
+        unpack = _unpack_grid_key
+        for key, (size_x, size_y, size_z) in self._voxels.items():
+            gx, gy, gz = unpack(key)
             if base_gy is None:
                 base_gy = gy
             elif gy != base_gy:
@@ -315,26 +1176,18 @@ class VoxelModel:
             if abs(size_x - grid_dim_x) > eps or abs(size_z - grid_dim_z) > eps:
                 return None
 
-            key = (gx, gz)
-            if key in heights:
-                return None
-            heights[key] = size_y
-
-        if not heights:
-            return []
-
-        base_y = base_gy * grid_dim_y
-
-        snapped = False
-        quantized = {}
-        for key, height in heights.items():
-            layers = int(round(height / grid_dim_y))
+            layers = int(round(size_y / grid_dim_y))
             if layers < 1:
                 layers = 1
-            quant_height = layers * grid_dim_y
-            if abs(quant_height - height) > eps:
+            height = layers * grid_dim_y
+            if abs(height - size_y) > eps:
                 snapped = True
-            quantized[key] = quant_height
+            heights[key] = height
+            column_layers[key] = layers
+            unique_heights.add(height)
+
+        if not heights:
+            return triangles
 
         if snapped:
             logger.warning(
@@ -342,411 +1195,511 @@ class VoxelModel:
                 grid_dim_y
             )
 
-        heights = quantized
-        triangles = []
-
-        unique_heights = sorted({0.0} | set(heights.values()))
-        cells = list(heights.items())
-
         if optimize:
-            uniform_dims = self._grid_dimensions()
-            temp_model = VoxelModel(voxel_dimensions=self.voxel_dimensions, coordinate_system=self._coordinate_system)
-            temp_model._voxels = {}
-            for (gx, gz), height in heights.items():
-                if height <= eps:
-                    continue
-                layers = int(round(height / grid_dim_y))
-                for layer in range(layers):
-                    temp_model._voxels[(gx, base_gy + layer, gz)] = uniform_dims
-            return temp_model._greedy_mesh()
-
-        for i in range(len(unique_heights) - 1):
-            h0 = unique_heights[i]
-            h1 = unique_heights[i + 1]
-            if h1 <= h0 + eps:
-                continue
-            y0 = base_y + h0
-            y1 = base_y + h1
+            return self._greedy_mesh_from_heightmap(triangles, column_layers, base_gy)
 
-            for (gx, gz), height in cells:
-                if height <= h0 + eps:
-                    continue
-                x0 = gx * grid_dim_x
-                x1 = x0 + grid_dim_x
-                z0 = gz * grid_dim_z
-                z1 = z0 + grid_dim_z
-
-                if heights.get((gx - 1, gz), 0.0) <= h0 + eps:
-                    rect = (y0, z0, y1, z1)
-                    self._append_face_rectangles(triangles, axis=0, direction=0, pos_on_axis=x0, rectangles=[rect])
-                if heights.get((gx + 1, gz), 0.0) <= h0 + eps:
-                    rect = (y0, z0, y1, z1)
-                    self._append_face_rectangles(triangles, axis=0, direction=1, pos_on_axis=x1, rectangles=[rect])
-                if heights.get((gx, gz - 1), 0.0) <= h0 + eps:
-                    rect = (x0, y0, x1, y1)
-                    self._append_face_rectangles(triangles, axis=2, direction=0, pos_on_axis=z0, rectangles=[rect])
-                if heights.get((gx, gz + 1), 0.0) <= h0 + eps:
-                    rect = (x0, y0, x1, y1)
-                    self._append_face_rectangles(triangles, axis=2, direction=1, pos_on_axis=z1, rectangles=[rect])
-
-                if not optimize:
-                    if height <= h1 + eps:
-                        rect_top = (z0, x0, z1, x1)
-                        self._append_face_rectangles(triangles, axis=1, direction=1, pos_on_axis=y1, rectangles=[rect_top])
-
-                    if i == 0:
-                        rect_bottom = (z0, x0, z1, x1)
-                        self._append_face_rectangles(triangles, axis=1, direction=0, pos_on_axis=y0, rectangles=[rect_bottom])
+        # Side walls are split into bands at every distinct column height, so
+        # that faces of neighboring columns meet edge to edge. A side face of a
+        # column is exposed exactly in the bands between its neighbor's height
+        # and its own, so each column only visits its own bands instead of every
+        # column being rescanned for every band.
+        base_y = base_gy * grid_dim_y
+        unique_heights = sorted(unique_heights)
+        band_index = {height: i for i, height in enumerate(unique_heights)}
+        band_y = [base_y + height for height in unique_heights]
+        bottom_y = band_y[0]
+        append_rectangles = self._append_face_rectangles
+        stride_x = _KEY_STRIDES[0]
+        stride_z = _KEY_STRIDES[2]
+
+        height_at = heights.get
+        for key, height in heights.items():
+            gx, _, gz = unpack(key)
+            top = band_index[height]
+            x0 = gx * grid_dim_x
+            x1 = x0 + grid_dim_x
+            z0 = gz * grid_dim_z
+            z1 = z0 + grid_dim_z
+
+            exposed = range(band_index[height_at(key - stride_x, 0.0)], top)
+            if exposed:
+                append_rectangles(triangles, axis=0, direction=0, pos_on_axis=x0,
+                                  rectangles=[(band_y[i], z0, band_y[i + 1], z1) for i in exposed])
+            exposed = range(band_index[height_at(key + stride_x, 0.0)], top)
+            if exposed:
+                append_rectangles(triangles, axis=0, direction=1, pos_on_axis=x1,
+                                  rectangles=[(band_y[i], z0, band_y[i + 1], z1) for i in exposed])
+            exposed = range(band_index[height_at(key - stride_z, 0.0)], top)
+            if exposed:
+                append_rectangles(triangles, axis=2, direction=0, pos_on_axis=z0,
+                                  rectangles=[(x0, band_y[i], x1, band_y[i + 1]) for i in exposed])
+            exposed = range(band_index[height_at(key + stride_z, 0.0)], top)
+            if exposed:
+                append_rectangles(triangles, axis=2, direction=1, pos_on_axis=z1,
+                                  rectangles=[(x0, band_y[i], x1, band_y[i + 1]) for i in exposed])
+
+            cap = [(z0, x0, z1, x1)]
+            append_rectangles(triangles, axis=1, direction=1, pos_on_axis=band_y[top], rectangles=cap)
+            append_rectangles(triangles, axis=1, direction=0, pos_on_axis=bottom_y, rectangles=cap)
 
         return triangles
 
-    def _greedy_mesh(self):
+    def _greedy_mesh(self, triangles):
         """
         Generates an optimized mesh using greedy meshing algorithm.
         Merges adjacent coplanar faces into larger rectangles to reduce triangle count.
 
+        Args:
+            triangles (list): The output triangle list to append to.
+
         Returns:
             list: A list of tuples, where each tuple is a triangle defined as
                 (normal, vertex1, vertex2, vertex3).
         """
         if not self._voxels:
-            return []
+            return triangles
 
-        logger.info(f"Generating optimized mesh using greedy meshing for {len(self._voxels)} voxels...")
-        triangles = []
+        logger.info("Generating optimized mesh using greedy meshing for %d voxels...", len(self._voxels))
 
-        # For each axis direction, collect exposed faces and merge them
-        # Axes: 0=X, 1=Y, 2=Z; Directions: 0=negative, 1=positive
-        for axis in range(3):  # X, Y, Z
-            for direction in [0, 1]:  # negative, positive
-                # Get all exposed faces for this direction
-                faces = self._collect_faces_for_direction(axis, direction)
+        # For each axis direction, collect exposed faces and merge them slice by slice
+        for axis, direction, slice_idx, rows, u_origin in self._exposed_face_rows():
+            self._merge_slice_rows(triangles, axis, direction, slice_idx, rows, u_origin)
 
-                # Group faces by their position along the normal axis (slices)
-                slices = {}
-                for face in faces:
-                    slice_pos = face['pos_on_axis']
-                    if slice_pos not in slices:
-                        slices[slice_pos] = []
-                    slices[slice_pos].append(face)
-
-                # Apply greedy meshing to each slice
-                for slice_pos, slice_faces in slices.items():
-                    merged = self._greedy_merge_slice(slice_faces, axis)
-                    triangles.extend(merged)
-
-        logger.info(f"Greedy mesh generation complete. Optimized to {len(triangles)} triangles.")
+        logger.info("Greedy mesh generation complete. Optimized to %d triangles.", len(triangles))
+        return triangles
+
+    def _unit_face_mesh(self, triangles):
+        """
+        Generates an unoptimized mesh for a model made entirely of default-sized
+        voxels: one quad per exposed voxel face, as the partial adjacency path
+        would emit, but found with the same whole-grid face collection the
+        greedy mesher uses instead of probing neighbors voxel by voxel.
+
+        Args:
+            triangles (list): The output triangle list to append to.
+
+        Returns:
+            list: A list of tuples, where each tuple is a triangle defined as
+                (normal, vertex1, vertex2, vertex3).
+        """
+        logger.info("Generating mesh for %d voxels...", len(self._voxels))
+        append = triangles.append
+        grid_dims = self._grid_dims
+        build_quad_triangles = self._build_quad_triangles
+
+        for axis, direction, slice_idx, rows, u_origin in self._exposed_face_rows():
+            u_size = grid_dims[(axis + 1) % 3]
+            v_size = grid_dims[(axis + 2) % 3]
+            normal = self._normals[axis, direction]
+            pos_on_axis = slice_idx * grid_dims[axis]
+            if direction == 1:
+                pos_on_axis += grid_dims[axis]
+            for v_idx, mask in rows.items():
+                v_start = v_idx * v_size
+                while mask:
+                    low = mask & -mask
+                    mask ^= low
+                    u_start = (low.bit_length() - 1 + u_origin) * u_size
+                    first, second = build_quad_triangles(normal, axis, direction, pos_on_axis,
+                                                         u_start, v_start, u_size, v_size)
+                    append(first)
+                    append(second)
+
+        logger.info("Mesh generation complete. Emitted %d face segments, resulting in %d triangles.",
+                    len(triangles) // 2, len(triangles))
+        return triangles
+
+    def _exposed_face_rows(self):
+        """
+        Yields the exposed faces of a uniform model slice by slice, packed into
+        the per-row bitmasks taken by _merge_slice_rows.
+
+        Rows come straight out of the dense bitsets when the bounding box allows
+        it; otherwise the faces are found with per-voxel neighbor lookups and
+        packed here.
+
+        Yields:
+            tuple: (axis, direction, slice_idx, rows, u_origin) with axis
+                   0=X, 1=Y, 2=Z and direction 0=negative, 1=positive.
+        """
+        dense_faces = self._collect_faces_dense()
+        for axis in range(3):
+            for direction in (0, 1):
+                if dense_faces is not None:
+                    u_origin, slices = dense_faces[axis, direction]
+                    for slice_idx, rows in slices.items():
+                        yield axis, direction, slice_idx, rows, u_origin
+                    continue
+
+                slices = self._collect_faces_for_direction(axis, direction)
+                for slice_idx, (u_indices, v_indices) in slices.items():
+                    # Pack the slice into one bitmask per row: bit (u - u_origin)
+                    # of rows[v] is set when the face at (u, v) is exposed.
+                    u_origin = min(u_indices)
+                    rows = {}
+                    for u_idx, v_idx in zip(u_indices, v_indices):
+                        rows[v_idx] = rows.get(v_idx, 0) | (1 << (u_idx - u_origin))
+                    yield axis, direction, slice_idx, rows, u_origin
+
+    def _greedy_mesh_from_heightmap(self, triangles, column_layers, base_gy):
+        """
+        Generates an optimized mesh for a heightmap directly from its columns.
+
+        Produces the same merged faces as voxelizing every column layer and
+        running _greedy_mesh, without materializing one voxel per layer: top
+        and bottom faces come straight from the columns, and the exposed side
+        faces of a column are the layers above its neighbor's height.
+
+        Args:
+            triangles (list): The output triangle list to append to.
+            column_layers (dict): Maps the packed grid key of each column's bottom
+                                  voxel to the column height in layers.
+            base_gy (int): Grid Y index of the bottom layer of every column.
+
+        Returns:
+            list: A list of tuples, where each tuple is a triangle defined as
+                (normal, vertex1, vertex2, vertex3).
+        """
+        logger.info("Generating optimized heightmap mesh for %d columns...", len(column_layers))
+        columns = [(key, _unpack_grid_key(key), layers) for key, layers in column_layers.items()]
+        min_gx = min(coord[0] for _, coord, _ in columns)
+        min_gz = min(coord[2] for _, coord, _ in columns)
+        stride_x = _KEY_STRIDES[0]
+        stride_z = _KEY_STRIDES[2]
+        # Bit 0 of each row along u, per normal axis (u is Y, Z, X respectively)
+        u_origins = (base_gy, min_gz, min_gx)
+
+        # (axis, direction) -> slice index -> row v -> bitmask over u
+        slices = {(axis, direction): {} for axis in range(3) for direction in (0, 1)}
+        for key, (gx, _, gz), layers in columns:
+            # Bottom and top faces (u = Z, v = X)
+            bit = 1 << (gz - min_gz)
+            rows = slices[1, 0].setdefault(base_gy, {})
+            rows[gx] = rows.get(gx, 0) | bit
+            rows = slices[1, 1].setdefault(base_gy + layers - 1, {})
+            rows[gx] = rows.get(gx, 0) | bit
+
+            # X side faces (u = Y, v = Z): a whole run of layers per column
+            for direction, neighbor in ((0, key - stride_x), (1, key + stride_x)):
+                covered = column_layers.get(neighbor, 0)
+                if covered < layers:
+                    rows = slices[0, direction].setdefault(gx, {})
+                    rows[gz] = (1 << layers) - (1 << covered)
+
+            # Z side faces (u = X, v = Y): one bit per exposed layer
+            bit = 1 << (gx - min_gx)
+            for direction, neighbor in ((0, key - stride_z), (1, key + stride_z)):
+                covered = column_layers.get(neighbor, 0)
+                if covered < layers:
+                    rows = slices[2, direction].setdefault(gz, {})
+                    for gy in range(base_gy + covered, base_gy + layers):
+                        rows[gy] = rows.get(gy, 0) | bit
+
+        for (axis, direction), axis_slices in slices.items():
+            for slice_idx, rows in axis_slices.items():
+                self._merge_slice_rows(triangles, axis, direction, slice_idx,
+                                       rows, u_origins[axis])
+
+        logger.info("Heightmap mesh generation complete. Optimized to %d triangles.", len(triangles))
         return triangles
 
     def _collect_faces_for_direction(self, axis, direction):
         """
         Collects all exposed faces for a given axis direction.
 
+        Only used for models made entirely of default-sized voxels, so a face
+        is exposed exactly when the neighboring grid cell is empty. Faces are
+        returned as parallel lists of grid indices (structure of arrays) rather
+        than one dictionary per face.
+
         Args:
             axis (int): 0=X, 1=Y, 2=Z
             direction (int): 0=negative face, 1=positive face
 
         Returns:
-            list: List of face dictionaries with position and size information
-        """
-        faces = []
-        offset = [0, 0, 0]
-        offset[axis] = -1 if direction == 0 else 1
-
-        for (gx, gy, gz), (size_x, size_y, size_z) in self._voxels.items():
-            neighbor_coord = (gx + offset[0], gy + offset[1], gz + offset[2])
-            neighbor_dims = self._voxels.get(neighbor_coord)
-
-            # Dimensions are already stored in internal Y-up representation
-            build_size_x, build_size_y, build_size_z = size_x, size_y, size_z
-            grid_dim_x, grid_dim_y, grid_dim_z = self.voxel_dimensions
-            if self._coordinate_system == 'z_up':
-                grid_dim_y, grid_dim_z = grid_dim_z, grid_dim_y
-
-            # Face is exposed if no neighbor or neighbor has different dimensions
-            if not neighbor_dims or neighbor_dims != (size_x, size_y, size_z):
-                # Calculate face position in world coordinates
-                min_cx = gx * grid_dim_x
-                min_cy = gy * grid_dim_y
-                min_cz = gz * grid_dim_z
-
-                # Position along the normal axis
-                pos_on_axis = [min_cx, min_cy, min_cz][axis]
-                if direction == 1:  # Positive face
-                    pos_on_axis += [build_size_x, build_size_y, build_size_z][axis]
-
-                # The two axes perpendicular to the normal
-                u_axis = (axis + 1) % 3
-                v_axis = (axis + 2) % 3
-
-                u_pos = [min_cx, min_cy, min_cz][u_axis]
-                v_pos = [min_cx, min_cy, min_cz][v_axis]
-                u_size = [build_size_x, build_size_y, build_size_z][u_axis]
-                v_size = [build_size_x, build_size_y, build_size_z][v_axis]
-
-                faces.append({
-                    'axis': axis,
-                    'direction': direction,
-                    'pos_on_axis': pos_on_axis,
-                    'u_pos': u_pos,
-                    'v_pos': v_pos,
-                    'u_size': u_size,
-                    'v_size': v_size,
-                    'grid_coord': (gx, gy, gz),
-                    'dimensions': (size_x, size_y, size_z)
-                })
+            dict: Maps each voxel grid index along the normal axis (a slice) to
+                  a pair of lists (u_indices, v_indices) holding the in-plane
+                  grid indices of the exposed faces in that slice.
+        """
+        slices = {}
+        neighbor_delta = _KEY_STRIDES[axis] if direction == 1 else -_KEY_STRIDES[axis]
 
-        return faces
+        # The two axes perpendicular to the normal
+        u_axis = (axis + 1) % 3
+        v_axis = (axis + 2) % 3
 
-    def _greedy_merge_slice(self, faces, axis):
+        # Filter the exposed keys in one comprehension, then read the grid
+        # indices straight out of the packed key fields instead of unpacking
+        # each key into a full coordinate tuple.
+        voxels = self._voxels
+        exposed = [key for key in voxels if key + neighbor_delta not in voxels]
+
+        slice_shift = _KEY_BITS * axis
+        u_shift = _KEY_BITS * u_axis
+        v_shift = _KEY_BITS * v_axis
+        for key in exposed:
+            slice_idx = ((key >> slice_shift) & _KEY_MASK) - _KEY_OFFSET
+            slice_faces = slices.get(slice_idx)
+            if slice_faces is None:
+                slice_faces = slices[slice_idx] = ([], [])
+            slice_faces[0].append(((key >> u_shift) & _KEY_MASK) - _KEY_OFFSET)
+            slice_faces[1].append(((key >> v_shift) & _KEY_MASK) - _KEY_OFFSET)
+
+        return slices
+
+    def _collect_faces_dense(self):
         """
-        Merges coplanar faces in a slice using greedy meshing algorithm.
+        Collects the exposed faces of all six directions using dense occupancy
+        bitsets of the model's bounding box.
 
-        Args:
-            faces (list): List of face dictionaries in the same slice
-            axis (int): The normal axis (0=X, 1=Y, 2=Z)
+        Occupancy comes from the model's _OccupancyGrid, built here on first use
+        and then kept up to date by every voxel mutation, and is read into one
+        Python integer per normal axis. The exposed faces of a direction are
+        then one shift-and-mask over the whole grid, e.g.
+        ``occ & ~(occ >> slice_bits)`` for the positive side, instead of one
+        neighbor lookup per voxel, and every nonzero row of the result is
+        already a bitmask as taken by _merge_slice_rows.
+
+        Like _collect_faces_for_direction, only valid for uniform voxels.
 
         Returns:
-            list: List of triangles for the merged faces
-        """
-        if not faces:
-            return []
-
-        triangles = []
-        direction = faces[0]['direction']
-        pos_on_axis = faces[0]['pos_on_axis']
-
-        # Build a grid of faces by their u,v positions and sizes
-        # Face positions are in internal Y-up space, so use swapped grid dims if needed
-        grid_dims = list(self.voxel_dimensions)
-        if self._coordinate_system == 'z_up':
-            grid_dims[1], grid_dims[2] = grid_dims[2], grid_dims[1]
-
-        face_grid = {}
-        for face in faces:
-            # Use grid coordinates for lookup (only works for uniform voxels)
-            u_idx = int(round(face['u_pos'] / grid_dims[(axis + 1) % 3]))
-            v_idx = int(round(face['v_pos'] / grid_dims[(axis + 2) % 3]))
-            u_size = face['u_size']
-            v_size = face['v_size']
-
-            key = (u_idx, v_idx, u_size, v_size)
-            face_grid[key] = face
-
-        # Greedy meshing: merge adjacent faces with same dimensions
-        used = set()
-        sorted_faces = sorted(face_grid.items(), key=lambda x: (x[0][1], x[0][0]))  # Sort by v, then u
-
-        for (u_idx, v_idx, u_size, v_size), face in sorted_faces:
-            if (u_idx, v_idx) in used:
+            dict or None: Maps (axis, direction) to a pair (u_origin, slices),
+                          where slices maps each slice index to its rows dict
+                          (v grid index -> bitmask with bit u - u_origin set per
+                          exposed face), or None if the bounding box is too
+                          large for a dense grid.
+        """
+        grid = self._occupancy
+        if grid is None:
+            grid = _build_occupancy_grid(self._voxels)
+            if grid is None:
+                return None
+            self._occupancy = grid
+        mins = grid.mins
+        sizes = grid.sizes
+
+        faces = {}
+        for axis, (u_axis, v_axis, row_bytes, slice_bits, _) in enumerate(grid.layouts):
+            min_u, min_v, min_s = mins[u_axis], mins[v_axis], mins[axis]
+            rows_per_slice = sizes[v_axis]
+            if sizes[axis] == 1:
+                # A single slice, as in a flat slab: every filled cell is
+                # exposed on both sides, so scan the occupancy once and share
+                # the rows between the two directions
+                rows = {}
+                data = grid.bits[axis]
+                for match in _NONZERO_RUN.finditer(data):
+                    for row in range(match.start() // row_bytes, (match.end() - 1) // row_bytes + 1):
+                        start = row * row_bytes
+                        rows[row + min_v] = int.from_bytes(data[start:start + row_bytes], 'little')
+                faces[axis, 0] = faces[axis, 1] = (min_u, {min_s: rows} if rows else {})
                 continue
 
-            # Try to extend in u direction
-            u_end = u_idx
-            while (u_end + 1, v_idx, u_size, v_size) in face_grid and (u_end + 1, v_idx) not in used:
-                u_end += 1
-
-            # Try to extend in v direction
-            v_end = v_idx
-            can_extend = True
-            while can_extend:
-                # Check if entire row exists for v_end + 1
-                for u in range(u_idx, u_end + 1):
-                    if (u, v_end + 1, u_size, v_size) not in face_grid or (u, v_end + 1) in used:
-                        can_extend = False
-                        break
-                if can_extend:
-                    v_end += 1
-
-            # Mark all merged faces as used
-            for v in range(v_idx, v_end + 1):
-                for u in range(u_idx, u_end + 1):
-                    used.add((u, v))
+            byte_count = len(grid.bits[axis])
+            occupancy = int.from_bytes(grid.bits[axis], 'little')
 
-            # Create merged rectangle
-            u_axis_idx = (axis + 1) % 3
-            v_axis_idx = (axis + 2) % 3
-
-            # Use the already-swapped grid_dims from above
-            u_start = u_idx * grid_dims[u_axis_idx]
-            v_start = v_idx * grid_dims[v_axis_idx]
-            u_length = (u_end - u_idx + 1) * u_size
-            v_length = (v_end - v_idx + 1) * v_size
-
-            # Build vertices for the merged rectangle
-            verts = self._build_rect_vertices(axis, direction, pos_on_axis,
-                                              u_start, v_start, u_length, v_length)
-
-            # Create normal
-            normal = [0, 0, 0]
-            normal[axis] = 1 if direction == 1 else -1
-            normal = tuple(normal)
-
-            # Swap Y/Z for Z-up mode
-            if self._coordinate_system == 'z_up':
-                verts = [(v[0], v[2], v[1]) for v in verts]
-                normal = (normal[0], normal[2], normal[1])
-
-            # Create triangles with proper winding
-            if self._coordinate_system == 'z_up':
-                triangles.append((normal, verts[0], verts[2], verts[1]))
-                triangles.append((normal, verts[0], verts[3], verts[2]))
-            else:
-                triangles.append((normal, verts[0], verts[1], verts[2]))
-                triangles.append((normal, verts[0], verts[2], verts[3]))
+            # Shifting by a whole slice never wraps, so no padding is needed:
+            # cells past either end of the normal axis simply read as empty.
+            for direction in (0, 1):
+                if direction == 1:
+                    exposed = occupancy & ~(occupancy >> slice_bits)
+                else:
+                    exposed = occupancy & ~(occupancy << slice_bits)
 
-        return triangles
+                slices = {}
+                data = exposed.to_bytes(byte_count, 'little')
+                for match in _NONZERO_RUN.finditer(data):
+                    for row in range(match.start() // row_bytes, (match.end() - 1) // row_bytes + 1):
+                        slice_pos, v_pos = divmod(row, rows_per_slice)
+                        rows = slices.get(slice_pos + min_s)
+                        if rows is None:
+                            rows = slices[slice_pos + min_s] = {}
+                        start = row * row_bytes
+                        rows[v_pos + min_v] = int.from_bytes(data[start:start + row_bytes], 'little')
+                faces[axis, direction] = (min_u, slices)
 
-    def _build_rect_vertices(self, axis, direction, pos_on_axis, u_start, v_start, u_length, v_length):
-        """
-        Builds the 4 vertices of a rectangle for a given axis direction.
+        return faces
 
-        Returns:
-            list: List of 4 vertex tuples in counter-clockwise order
+    def _merge_slice_rows(self, triangles, axis, direction, slice_idx, rows, u_origin):
         """
-        u_axis = (axis + 1) % 3
-        v_axis = (axis + 2) % 3
+        Greedily merges a slice given as per-row bitmasks and appends its triangles.
 
-        # Build 4 corners
-        verts = []
-        for v_offset in [0, v_length]:
-            for u_offset in [0, u_length]:
-                vert = [0, 0, 0]
-                vert[axis] = pos_on_axis
-                vert[u_axis] = u_start + u_offset
-                vert[v_axis] = v_start + v_offset
-                verts.append(tuple(vert))
-
-        # Reorder for CCW winding based on axis and direction
-        # Order: bottom-left, bottom-right, top-right, top-left
-        if axis == 0:  # X axis (YZ plane)
-            if direction == 0:  # -X face
-                verts = [verts[0], verts[2], verts[3], verts[1]]
-            else:  # +X face
-                verts = [verts[0], verts[1], verts[3], verts[2]]
-        elif axis == 1:  # Y axis (XZ plane)
-            if direction == 0:  # -Y face (looking up from below)
-                verts = [verts[0], verts[2], verts[3], verts[1]]
-            else:  # +Y face (looking down from above)
-                verts = [verts[0], verts[1], verts[3], verts[2]]
-        else:  # Z axis (XY plane)
-            if direction == 0:  # -Z face
-                verts = [verts[0], verts[2], verts[3], verts[1]]
-            else:  # +Z face
-                verts = [verts[0], verts[1], verts[3], verts[2]]
-
-        return verts
-
-    def generate_mesh(self, optimize=True):
-        """
-        Generates a list of triangles representing the exposed faces of the voxels.
+        Args:
+            triangles (list): The output triangle list to append to.
+            axis (int): The normal axis (0=X, 1=Y, 2=Z)
+            direction (int): 0=negative face, 1=positive face
+            slice_idx (int): Grid index of the voxels owning the faces, along the normal axis
+            rows (dict): Maps each v grid index to a bitmask whose bit (u - u_origin)
+                         is set when the face at (u, v) is exposed.
+            u_origin (int): Grid index along u of bit 0 in every row.
+        """
+        append = triangles.append
+        grid_dims = self._grid_dims
+        u_size = grid_dims[(axis + 1) % 3]
+        v_size = grid_dims[(axis + 2) % 3]
+        normal = self._normals[axis, direction]
+        build_quad_triangles = self._build_quad_triangles
+
+        pos_on_axis = slice_idx * grid_dims[axis]
+        if direction == 1:
+            pos_on_axis += grid_dims[axis]
+
+        for u0, v0, u1, v1 in _greedy_merge_rows(rows):
+            # Create merged rectangle
+            u_start = (u0 + u_origin) * u_size
+            v_start = v0 * v_size
+            u_length = (u1 - u0) * u_size
+            v_length = (v1 - v0) * v_size
+
+            # Build the two triangles of the merged rectangle
+            first, second = build_quad_triangles(normal, axis, direction, pos_on_axis,
+                                                 u_start, v_start, u_length, v_length)
+            append(first)
+            append(second)
+
+    def generate_mesh(self, optimize=True, flat=False):
+        """
+        Generates the triangles representing the exposed faces of the voxels.
 
         Ensures consistent counter-clockwise winding order (right-hand rule)
         for outward-facing normals.
 
+        The triangles are kept for each ``optimize`` setting until the voxels
+        next change, so generating or saving the same mesh again does not
+        re-mesh the model; the same tuple is returned each time.
+
         Args:
             optimize (bool): If True, uses greedy meshing algorithm to merge adjacent
                            coplanar faces, significantly reducing triangle count.
                            Default: True (recommended for most use cases).
+            flat (bool): If True, returns the mesh as flat float32 buffers instead
+                       of a tuple of triangles, which takes about a tenth of the memory
+                       for large meshes. Default: False.
 
         Returns:
-            list: A list of tuples, where each tuple is a triangle defined as
-                (normal, vertex1, vertex2, vertex3). Coordinates are in
-                the model's world space. Returns an empty list if no voxels
-                have been added.
+            tuple: The triangles, each a tuple (normal, vertex1, vertex2,
+                vertex3). Coordinates are in the model's world space.
+                Empty if no voxels have been added.
+
+            If ``flat`` is True, a tuple ``(normals, vertices)`` of
+            ``array.array('f')`` buffers instead: ``normals`` holds 3 floats
+            per triangle and ``vertices`` holds 9 (three xyz vertices). Both are
+            empty if no voxels have been added.
+        """
+        if not self._voxels:
+            # Nothing to mesh: skip choosing a meshing path altogether
+            return (array('f'), array('f')) if flat else ()
+
+        optimize = bool(optimize)
+        cached = self._mesh_cache.get(optimize)
+        if flat:
+            buffers = _FlatTriangles()
+            if cached is None:
+                # Flat output exists to avoid holding the triangle list, so
+                # mesh straight into the buffers without caching
+                self._triangulate(optimize, buffers)
+            else:
+                for triangle in cached:
+                    buffers.append(triangle)
+            return buffers.normals, buffers.vertices
+
+        if cached is None:
+            # Kept as a tuple, so it can be handed out without a copy
+            cached = self._mesh_cache[optimize] = tuple(self._triangulate(optimize, []))
+        return cached
+
+    def _triangulate(self, optimize, triangles):
+        """
+        Appends the mesh triangles to ``triangles`` and returns it.
+
+        ``triangles`` only needs ``append`` and ``len``, so save_mesh can pass
+        a writer's record buffer and skip building the triangle list.
         """
         if not self._voxels:
-            return []
+            return triangles
 
         use_greedy = optimize and self._can_use_greedy_meshing()
         if use_greedy:
-            return self._greedy_mesh()
+            return self._greedy_mesh(triangles)
 
-        heightmap_triangles = self._heightmap_mesh(optimize=optimize)
-        if heightmap_triangles is not None:
+        if self._heightmap_mesh(triangles, optimize=optimize) is not None:
             if optimize:
                 logger.warning("Using heightmap meshing for non-uniform voxel dimensions.")
-            return heightmap_triangles
+            return triangles
 
         if optimize:
             logger.warning("Greedy meshing disabled for non-uniform voxel dimensions; using partial adjacency meshing.")
-
-        logger.info(f"Generating mesh for {len(self._voxels)} voxels...")
-        triangles = []
-        eps = 1e-9
-
-        faces_data = [
-            (0, 1, (1, 0, 0)),  # +X
-            (0, 0, (-1, 0, 0)), # -X
-            (1, 1, (0, 1, 0)),  # +Y
-            (1, 0, (0, -1, 0)), # -Y
-            (2, 1, (0, 0, 1)),  # +Z
-            (2, 0, (0, 0, -1)), # -Z
-        ]
-
-        processed_faces = 0
-        for grid_coord, voxel_dims in self._voxels.items():
-            min_cx, min_cy, min_cz = self._voxel_min_corner(grid_coord)
-            min_corner = (min_cx, min_cy, min_cz)
-            size_x, size_y, size_z = voxel_dims
-            sizes = (size_x, size_y, size_z)
-
-            gx, gy, gz = grid_coord
-            for axis, direction, offset in faces_data:
-                neighbor_coord = (gx + offset[0], gy + offset[1], gz + offset[2])
-                neighbor_dims = self._voxels.get(neighbor_coord)
-
-                pos_on_axis = min_corner[axis] + (sizes[axis] if direction == 1 else 0)
-                u_axis = (axis + 1) % 3
-                v_axis = (axis + 2) % 3
-                u_start = min_corner[u_axis]
-                v_start = min_corner[v_axis]
-                u_length = sizes[u_axis]
-                v_length = sizes[v_axis]
-
-                rectangles = [(u_start, v_start, u_start + u_length, v_start + v_length)]
-
-                if neighbor_dims:
-                    neighbor_min = self._voxel_min_corner(neighbor_coord)
-                    neighbor_sizes = neighbor_dims
-                    neighbor_plane = neighbor_min[axis] if direction == 1 else neighbor_min[axis] + neighbor_sizes[axis]
-
-                    if abs(pos_on_axis - neighbor_plane) <= eps:
-                        n_u_start = neighbor_min[u_axis]
-                        n_v_start = neighbor_min[v_axis]
-                        n_u_length = neighbor_sizes[u_axis]
-                        n_v_length = neighbor_sizes[v_axis]
-
-                        x0 = u_start
-                        x1 = u_start + u_length
-                        y0 = v_start
-                        y1 = v_start + v_length
-                        nx0 = n_u_start
-                        nx1 = n_u_start + n_u_length
-                        ny0 = n_v_start
-                        ny1 = n_v_start + n_v_length
-
-                        ix0 = max(x0, nx0)
-                        ix1 = min(x1, nx1)
-                        iy0 = max(y0, ny0)
-                        iy1 = min(y1, ny1)
-
-                        if ix1 > ix0 + eps and iy1 > iy0 + eps:
-                            rectangles = []
-                            if ix0 > x0 + eps:
-                                rectangles.append((x0, y0, ix0, y1))
-                            if ix1 < x1 - eps:
-                                rectangles.append((ix1, y0, x1, y1))
-                            if iy0 > y0 + eps:
-                                rectangles.append((ix0, y0, ix1, iy0))
-                            if iy1 < y1 - eps:
-                                rectangles.append((ix0, iy1, ix1, y1))
-
-                if rectangles:
-                    processed_faces += len(rectangles)
-                    self._append_face_rectangles(triangles, axis, direction, pos_on_axis, rectangles)
-
-        logger.info(f"Mesh generation complete. Emitted {processed_faces} face segments, resulting in {len(triangles)} triangles.")
+        elif self._nonuniform_count == 0:
+            return self._unit_face_mesh(triangles)
+
+        logger.info("Generating mesh for %d voxels...", len(self._voxels))
+
+        # Precompute every voxel's bounding box once, so a face and its neighbor
+        # are both read from a single lookup by packed key
+        boxes, eps, scales = self._voxel_boxes()
+
+        # A face may be touched by several voxels, not just the one in the
+        # adjacent grid cell (voxels can span several cells). In grid units
+        # every touching voxel is found among the faces filed in its plane;
+        # otherwise only the adjacent voxel is considered.
+        face_planes = _index_face_planes(boxes) if not eps else None
+
+        # Face rectangles are gathered per face direction as
+        # (pos_on_axis, u0, v0, u1, v1) and turned into triangles in one batch
+        face_batches = [(face, []) for face in _FACES]
+        covered_faces = 0
+        box_at = boxes.get
+        subtract_rectangles = _subtract_rectangles
+        for (axis, direction, u_axis, v_axis, pos_index, neighbor_index, key_delta), batch in face_batches:
+            # Per-face views of a box: its (u0, v0, u1, v1) comparison extent,
+            # and the world-unit (pos, u0, v0, u1, v1) rectangle to emit
+            face_extent = itemgetter(u_axis, v_axis, u_axis + 3, v_axis + 3)
+            world_rect = itemgetter(pos_index + 6, u_axis + 6, v_axis + 6, u_axis + 9, v_axis + 9)
+            u_scale = scales[u_axis]
+            v_scale = scales[v_axis]
+            touching = face_planes[neighbor_index] if face_planes is not None else None
+            emit = batch.append
+            for key, box in boxes.items():
+                x0, y0, x1, y1 = face_extent(box)
+
+                # Fast path: the voxel in the adjacent grid cell covering this
+                # face entirely (always the case between equal-sized voxels)
+                neighbor_box = box_at(key + key_delta)
+                if neighbor_box and abs(box[pos_index] - neighbor_box[neighbor_index]) <= eps:
+                    nx0, ny0, nx1, ny1 = face_extent(neighbor_box)
+                    if nx0 <= x0 + eps and nx1 >= x1 - eps and ny0 <= y0 + eps and ny1 >= y1 - eps:
+                        covered_faces += 1
+                        continue
+
+                if touching is not None:
+                    # Opposite faces filed in this face's plane that overlap it
+                    plane = touching.get(box[pos_index])
+                    neighbors = plane.overlapping(x0, y0, x1, y1) if plane else ()
+                elif neighbor_box and abs(box[pos_index] - neighbor_box[neighbor_index]) <= eps:
+                    neighbors = (neighbor_box,)
+                else:
+                    neighbors = ()
+
+                if neighbors:
+                    pieces = subtract_rectangles(x0, y0, x1, y1, [face_extent(n) for n in neighbors], eps)
+                    if pieces is not None:
+                        if not pieces:
+                            covered_faces += 1
+                            continue
+                        # Back from comparison units to world units
+                        pos_on_axis = box[pos_index + 6]
+                        batch.extend([(pos_on_axis, r0 * u_scale, s0 * v_scale, r1 * u_scale, s1 * v_scale)
+                                      for r0, s0, r1, s1 in pieces])
+                        continue
+
+                emit(world_rect(box))
+
+        self._append_all_face_rectangles(triangles, [(face[0], face[1], batch) for face, batch in face_batches])
+
+        if logger.isEnabledFor(logging.INFO):
+            processed_faces = sum(len(batch) for _, batch in face_batches)
+            logger.info("Mesh generation complete. Emitted %d face segments, resulting in %d triangles "
+                        "(%d faces fully covered by neighbors).", processed_faces, len(triangles), covered_faces)
         return triangles
 
     def save_mesh(self, filename, format='stl_binary', optimize=True, **kwargs):
@@ -763,15 +1716,28 @@ class VoxelModel:
                            by 10-100x for regular voxel structures. Default: True.
             **kwargs: Additional arguments passed directly to the specific
                     file writer (e.g., 'solid_name' for STL formats).
+
+        Returns:
+            int: The number of bytes written, as reported by the writer, or 0
+                if the model is empty and no file was written.
         """
-        triangles = self.generate_mesh(optimize=optimize)
-        if not triangles:
+        if not self._voxels:
             logger.warning("No voxels in the model. Mesh file will not be generated.")
-            return
+            return 0
 
         try:
             writer = get_writer(format)
-            writer.write(triangles, filename, **kwargs)
+            cached = self._mesh_cache.get(bool(optimize))
+            if cached is not None:
+                # Already meshed since the last change to the voxels
+                size = writer.write(cached, filename, **kwargs)
+            elif hasattr(writer, 'write_records'):
+                # Writers with a record buffer take the triangles as they are
+                # generated, already packed, instead of a triangle list
+                records = self._triangulate(optimize, writer.new_record_buffer())
+                size = writer.write_records(records, filename, **kwargs)
+            else:
+                size = writer.write(self.generate_mesh(optimize=optimize), filename, **kwargs)
             # No need for logger.info here, the writer handles its own success message
         except ValueError as e:
             logger.error(f"Failed to save mesh: {e}")
@@ -779,3 +1745,4 @@ class VoxelModel:
         except Exception as e:
             logger.error(f"An error occurred during mesh saving to '{filename}': {e}")
             raise
+        return size
@@ -0,0 +1,86 @@
+# cubeforge/primitives.py
+import logging
+from .model import VoxelModel
+
+logger = logging.getLogger(__name__)
+
+
+def _check_counts(**counts):
+    """Raises ValueError unless every voxel count is a positive integer."""
+    for name, count in counts.items():
+        if not (isinstance(count, int) and count > 0):
+            raise ValueError(f"{name} must be a positive integer.")
+
+
+def hollow_box(nx, ny, nz, voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='y_up'):
+    """
+    Creates a box of voxels that is one voxel thick on every side.
+
+    Only the shell cells are generated, so building the model takes time in
+    proportion to the box's surface rather than its volume.
+
+    Args:
+        nx (int): Number of voxels along X.
+        ny (int): Number of voxels along Y.
+        nz (int): Number of voxels along Z.
+        voxel_dimensions (tuple): Size of each voxel, as for VoxelModel.
+        coordinate_system (str): 'y_up' (default) or 'z_up', as for VoxelModel.
+
+    Returns:
+        VoxelModel: A new model holding the shell, with its minimum corner at
+                    the origin.
+
+    Raises:
+        ValueError: If a voxel count is not a positive integer.
+    """
+    _check_counts(nx=nx, ny=ny, nz=nz)
+    model = VoxelModel(voxel_dimensions=voxel_dimensions, coordinate_system=coordinate_system,
+                       bbox=(nx, ny, nz))
+    size_x, size_y, size_z = model.voxel_dimensions
+
+    # Whole Z columns on the X and Y walls, only the two end caps elsewhere
+    z_all = [z * size_z for z in range(nz)]
+    z_caps = [0.0, (nz - 1) * size_z] if nz > 1 else [0.0]
+    coordinates = []
+    for x in range(nx):
+        x_wall = x == 0 or x == nx - 1
+        for y in range(ny):
+            z_values = z_all if x_wall or y == 0 or y == ny - 1 else z_caps
+            coordinates.extend((x * size_x, y * size_y, z) for z in z_values)
+
+    model.add_voxels(coordinates)
+    logger.info("Created hollow box of %dx%dx%d voxels (%d voxels).", nx, ny, nz, len(coordinates))
+    return model
+
+
+def checkerboard(nx, ny, voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='y_up'):
+    """
+    Creates a single layer of voxels in a checkerboard pattern.
+
+    The layer lies in the X-Y plane at z = 0, with a voxel wherever x + y is
+    even, so the voxel at the origin is always filled.
+
+    Args:
+        nx (int): Number of cells along X.
+        ny (int): Number of cells along Y.
+        voxel_dimensions (tuple): Size of each voxel, as for VoxelModel.
+        coordinate_system (str): 'y_up' (default) or 'z_up', as for VoxelModel.
+
+    Returns:
+        VoxelModel: A new model holding the filled cells.
+
+    Raises:
+        ValueError: If a cell count is not a positive integer.
+    """
+    _check_counts(nx=nx, ny=ny)
+    model = VoxelModel(voxel_dimensions=voxel_dimensions, coordinate_system=coordinate_system,
+                       bbox=(nx, ny, 1))
+    size_x, size_y, _ = model.voxel_dimensions
+
+    # Take every other cell of each row instead of testing every cell
+    coordinates = [(x * size_x, y * size_y, 0.0)
+                   for x in range(nx) for y in range(x % 2, ny, 2)]
+
+    model.add_voxels(coordinates)
+    logger.info("Created %dx%d checkerboard (%d voxels).", nx, ny, len(coordinates))
+    return model
@@ -1,10 +1,25 @@
 # cubeforge/writers.py
+import os
 import struct
 import logging
 import abc # Abstract Base Classes
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for output files; large enough that writing a mesh takes few
+# write() system calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _open_output(filename, mode):
+    """Opens an output file with a large write buffer for sequential writing."""
+    f = open(filename, mode, buffering=_WRITE_BUFFER_SIZE)
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass # Only an access hint; not available on every platform
+    return f
+
 
 class MeshWriterBase(abc.ABC):
     """Abstract base class for mesh file writers."""
@@ -20,6 +35,9 @@ class MeshWriterBase(abc.ABC):
                               Vertices and normals should be tuples/lists of 3 floats.
             filename (str): The path to the output file.
             **kwargs: Additional format-specific arguments.
+
+        Returns:
+            int: The number of bytes written to the file.
         """
         pass
 
@@ -35,21 +53,26 @@ class StlAsciiWriter(MeshWriterBase):
             triangles (list): List of (normal, v1, v2, v3) tuples.
             filename (str): Output filename.
             **kwargs: Expects 'solid_name' (str, optional).
+
+        Returns:
+            int: The number of bytes written to the file.
         """
         solid_name = kwargs.get("solid_name", "cubeforge_model")
         # Use the logger instance obtained at the module level
         logger.info(f"Writing ASCII STL file: {filename} with {len(triangles)} triangles.")
 
         try:
-            with open(filename, 'w') as f:
+            with _open_output(filename, 'w') as f:
                 f.write(f"solid {solid_name}\n")
                 for normal, v1, v2, v3 in triangles:
                     self._write_triangle(f, normal, v1, v2, v3)
                 f.write(f"endsolid {solid_name}\n")
+                size = f.tell()
             logger.info(f"Successfully wrote ASCII STL file: {filename}")
         except IOError as e:
             logger.error(f"Failed to write ASCII STL file {filename}: {e}")
             raise
+        return size
 
     def _write_triangle(self, f, normal, v1, v2, v3):
         """Writes a single triangle in ASCII STL format."""
@@ -62,9 +85,70 @@ class StlAsciiWriter(MeshWriterBase):
         f.write("  endfacet\n")
 
 
+# One Binary STL triangle record: normal, 3 vertices, attribute byte count
+_STL_RECORD = struct.Struct('<3f 3f 3f 3f H')
+
+
+class StlBinaryRecords:
+    """
+    Collects triangles as packed 50-byte Binary STL records.
+
+    Has the ``append``/``len`` interface of a triangle list, so a mesh can be
+    generated straight into it without building the list first.
+    """
+
+    __slots__ = ('data', '_count')
+
+    def __init__(self):
+        self.data = bytearray()
+        self._count = 0
+
+    def append(self, triangle):
+        """Packs one (normal, v1, v2, v3) triangle."""
+        normal, v1, v2, v3 = triangle
+        self.data += _STL_RECORD.pack(*normal, *v1, *v2, *v3, 0)
+        self._count += 1
+
+    def __len__(self):
+        return self._count
+
+
 class StlBinaryWriter(MeshWriterBase):
     """Writes mesh data to a Binary STL file."""
 
+    def new_record_buffer(self):
+        """Returns an empty StlBinaryRecords buffer for write_records."""
+        return StlBinaryRecords()
+
+    def write_records(self, records, filename, **kwargs):
+        """
+        Writes triangles already packed into an StlBinaryRecords buffer.
+
+        Args:
+            records (StlBinaryRecords): The packed triangles.
+            filename (str): Output filename.
+            **kwargs: Expects 'solid_name' (str, optional).
+
+        Returns:
+            int: The number of bytes written to the file.
+        """
+        solid_name = kwargs.get("solid_name", "cubeforge_model")
+        logger.info(f"Writing Binary STL file: {filename} with {len(records)} triangles.")
+
+        try:
+            with _open_output(filename, 'wb') as f:
+                header_name = solid_name[:80].encode('utf-8')
+                f.write(header_name + b'\x00' * (80 - len(header_name)))
+                f.write(struct.pack('<I', len(records)))
+                f.write(records.data)
+
+            logger.info(f"Successfully wrote Binary STL file: {filename}")
+        except IOError as e:
+            logger.error(f"Failed to write Binary STL file {filename}: {e}")
+            raise
+        # 80-byte header and 4-byte triangle count, then the records
+        return 84 + len(records.data)
+
     def write(self, triangles, filename, **kwargs):
         """
         Writes triangles to a Binary STL file.
@@ -73,43 +157,185 @@ class StlBinaryWriter(MeshWriterBase):
             triangles (list): List of (normal, v1, v2, v3) tuples.
             filename (str): Output filename.
             **kwargs: Expects 'solid_name' (str, optional).
+
+        Returns:
+            int: The number of bytes written to the file.
         """
         solid_name = kwargs.get("solid_name", "cubeforge_model")
         logger.info(f"Writing Binary STL file: {filename} with {len(triangles)} triangles.")
 
+        # Pack every triangle into one preallocated buffer (50 bytes each) and
+        # write it out in one call, instead of packing and writing per triangle
+        num_triangles = len(triangles)
+        try:
+            data = bytearray(num_triangles * _STL_RECORD.size)
+            pack_into = _STL_RECORD.pack_into
+            offset = 0
+            for normal, v1, v2, v3 in triangles:
+                pack_into(data, offset,
+                          normal[0], normal[1], normal[2],
+                          v1[0], v1[1], v1[2],
+                          v2[0], v2[1], v2[2],
+                          v3[0], v3[1], v3[2],
+                          0) # Attribute byte count = 0
+                offset += 50
+        except struct.error as e:
+            logger.error(f"Failed to pack data for Binary STL file {filename}: {e}")
+            raise
+
         try:
-            with open(filename, 'wb') as f:
+            with _open_output(filename, 'wb') as f:
                 # Write header (80 bytes)
                 header_name = solid_name[:80].encode('utf-8')
                 header = header_name + b'\x00' * (80 - len(header_name))
                 f.write(header)
 
                 # Write number of triangles (4-byte unsigned integer, little-endian)
-                num_triangles = len(triangles)
                 f.write(struct.pack('<I', num_triangles)) # I = unsigned int
 
-                # Write each triangle (50 bytes each)
-                for normal, v1, v2, v3 in triangles:
-                    self._write_triangle(f, normal, v1, v2, v3)
+                f.write(data)
 
             logger.info(f"Successfully wrote Binary STL file: {filename}")
         except IOError as e:
             logger.error(f"Failed to write Binary STL file {filename}: {e}")
             raise
-        except struct.error as e:
-            logger.error(f"Failed to pack data for Binary STL file {filename}: {e}")
-            raise
+        return 84 + len(data)
 
-    def _write_triangle(self, f, normal, v1, v2, v3):
-        """Writes a single triangle in Binary STL format."""
-        # Pack data as little-endian floats (f) and an unsigned short (H)
-        data = struct.pack('<3f 3f 3f 3f H',
-                           normal[0], normal[1], normal[2],
-                           v1[0], v1[1], v1[2],
-                           v2[0], v2[1], v2[2],
-                           v3[0], v3[1], v3[2],
-                           0) # Attribute byte count = 0
-        f.write(data)
+
+_UINT16_MAX = 0xFFFF
+# One PLY face record: vertex count (always 3) and three vertex indices
+_PLY_FACE = struct.Struct('<B3I')
+
+
+def _lattice_gcd(a, b, tolerance):
+    """
+    Returns the largest step that divides both a and b, ignoring float noise
+    up to the tolerance.
+    """
+    while b > tolerance:
+        a, b = b, a % b
+        if a - b <= tolerance:
+            # The remainder is a whole step that fell just short on rounding
+            b = 0.0
+    return a
+
+
+def _axis_quantization(values):
+    """
+    Picks how to store one coordinate axis as unsigned 16-bit integers.
+
+    Voxel meshes put their vertices on a lattice, so when the distinct values
+    are whole multiples of a common step and fit in 16 bits, that step is used
+    and the coordinates are stored exactly. Values closer together than float
+    noise (4.8 vs 4.800000000000001) count as one lattice point. Otherwise the
+    range is spread over the full 16 bits.
+
+    Args:
+        values (iterable): Every coordinate value along the axis.
+
+    Returns:
+        tuple: (offset, step) so that a value is stored as
+               round((value - offset) / step).
+    """
+    distinct = sorted(set(values))
+    if not distinct:
+        return 0.0, 1.0
+    offset = distinct[0]
+    span = distinct[-1] - offset
+    if span == 0:
+        return offset, 1.0
+    tolerance = span * 1e-9
+    points = [offset]
+    for value in distinct[1:]:
+        if value - points[-1] > tolerance:
+            points.append(value)
+    step = 0.0
+    for a, b in zip(points, points[1:]):
+        step = _lattice_gcd(step, b - a, tolerance)
+    if span / step <= _UINT16_MAX and all(
+            abs((v - offset) / step - round((v - offset) / step)) < 1e-6 for v in distinct):
+        return offset, step
+    return offset, span / _UINT16_MAX
+
+
+class PlyQuantizedWriter(MeshWriterBase):
+    """
+    Writes mesh data to a binary PLY file with 16-bit quantized vertices.
+
+    Shared vertices are stored once, each coordinate as an unsigned 16-bit
+    integer, and faces index into them, so the file is several times smaller
+    than Binary STL. World coordinates are ``offset + value * scale`` per
+    axis, with the offsets and scales given in the header comments
+    ``quantization_offset`` and ``quantization_scale``. Voxel meshes on a
+    regular grid are stored exactly; other meshes are rounded to 1/65535 of
+    their extent. Normals are not stored: faces keep the mesh's
+    counter-clockwise winding.
+    """
+
+    def write(self, triangles, filename, **kwargs):
+        """
+        Writes triangles to a quantized binary PLY file.
+
+        Args:
+            triangles (list): List of (normal, v1, v2, v3) tuples.
+            filename (str): Output filename.
+            **kwargs: Expects 'solid_name' (str, optional), written as a
+                      header comment.
+
+        Returns:
+            int: The number of bytes written to the file.
+        """
+        solid_name = kwargs.get("solid_name", "cubeforge_model")
+        logger.info(f"Writing quantized PLY file: {filename} with {len(triangles)} triangles.")
+
+        corners = [corner for _, v1, v2, v3 in triangles for corner in (v1, v2, v3)]
+        quantization = [_axis_quantization(corner[axis] for corner in corners) for axis in range(3)]
+        (offset_x, step_x), (offset_y, step_y), (offset_z, step_z) = quantization
+
+        # Quantize every corner, numbering each distinct vertex on first use
+        vertex_index = {}
+        indices = []
+        for x, y, z in corners:
+            vertex = (round((x - offset_x) / step_x),
+                      round((y - offset_y) / step_y),
+                      round((z - offset_z) / step_z))
+            index = vertex_index.get(vertex)
+            if index is None:
+                index = vertex_index[vertex] = len(vertex_index)
+            indices.append(index)
+
+        vertex_data = struct.pack(f'<{3 * len(vertex_index)}H',
+                                  *(c for vertex in vertex_index for c in vertex))
+        face_data = bytearray(len(triangles) * _PLY_FACE.size)
+        for i in range(len(triangles)):
+            _PLY_FACE.pack_into(face_data, i * _PLY_FACE.size, 3, *indices[3 * i:3 * i + 3])
+
+        header = (
+            "ply\n"
+            "format binary_little_endian 1.0\n"
+            f"comment {solid_name}\n"
+            f"comment quantization_offset {offset_x!r} {offset_y!r} {offset_z!r}\n"
+            f"comment quantization_scale {step_x!r} {step_y!r} {step_z!r}\n"
+            f"element vertex {len(vertex_index)}\n"
+            "property ushort x\n"
+            "property ushort y\n"
+            "property ushort z\n"
+            f"element face {len(triangles)}\n"
+            "property list uchar uint vertex_indices\n"
+            "end_header\n"
+        ).encode('utf-8')
+
+        try:
+            with _open_output(filename, 'wb') as f:
+                f.write(header)
+                f.write(vertex_data)
+                f.write(face_data)
+
+            logger.info(f"Successfully wrote quantized PLY file: {filename}")
+        except IOError as e:
+            logger.error(f"Failed to write quantized PLY file {filename}: {e}")
+            raise
+        return len(header) + len(vertex_data) + len(face_data)
 
 
 # --- Factory Function ---
@@ -117,6 +343,7 @@ _writer_map = {
     'stl': StlBinaryWriter,
     'stl_binary': StlBinaryWriter,
     'stl_ascii': StlAsciiWriter,
+    'ply_quantized': PlyQuantizedWriter,
 }
 
 def get_writer(format_id):
@@ -107,11 +107,13 @@ model_comp_z.save_mesh(output_filename, format='stl_binary', solid_name="Compari
 print(f"Saved '{output_filename}' (Z-up mode)")
 print("Load both in an STL viewer to see the difference!")
 
-print("\n" + "="*60)
-print("All coordinate system examples completed!")
-print("="*60)
-print("\nSummary:")
-print("- Y-up mode (default): Good for mathematical consistency, but")
-print("  models appear rotated in most STL viewers")
-print("- Z-up mode: Recommended for 3D printing! Models appear")
-print("  correctly oriented in slicers like Cura, PrusaSlicer, etc.")
+# Write the closing summary in one go
+lines = ["\n" + "="*60,
+         "All coordinate system examples completed!",
+         "="*60,
+         "\nSummary:",
+         "- Y-up mode (default): Good for mathematical consistency, but",
+         "  models appear rotated in most STL viewers",
+         "- Z-up mode: Recommended for 3D printing! Models appear",
+         "  correctly oriented in slicers like Cura, PrusaSlicer, etc."]
+sys.stdout.write("\n".join(lines) + "\n")
@@ -1,10 +1,14 @@
 # examples/mesh_optimization.py
 
+import argparse
+import io
 import logging
 import sys
 import os
 import random
+import struct
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
@@ -18,253 +22,240 @@ import cubeforge
 output_dir = os.path.dirname(__file__)
 os.makedirs(output_dir, exist_ok=True)
 
-def analyze_mesh(triangles, tol=1e-6):
-    def q(v):
-        return (round(v[0] / tol) * tol, round(v[1] / tol) * tol, round(v[2] / tol) * tol)
-
-    edge_counts = Counter()
-    for _, v1, v2, v3 in triangles:
-        verts = [q(v1), q(v2), q(v3)]
-        edges = [(verts[0], verts[1]), (verts[1], verts[2]), (verts[2], verts[0])]
-        for a, b in edges:
-            if a <= b:
-                edge_counts[(a, b)] += 1
-            else:
-                edge_counts[(b, a)] += 1
-
+def analyze_mesh(vertices, tol=1e-6):
+    """
+    Counts open and non-manifold edges of a mesh.
+
+    Takes the flat ``vertices`` buffer of ``generate_mesh(flat=True)``: 9
+    floats, three xyz vertices, per triangle.
+    """
+    # Vertices are shared by many triangles, so quantize each distinct vertex
+    # once and give every quantized position a small integer id. Each edge is
+    # then packed into one int, (low id << 32) | high id, which hashes faster
+    # than a pair.
+    vertex_ids = {}
+    position_ids = {}
+    ids = []
+    # Look vertices up by their 12 raw float32 bytes; only new ones are unpacked
+    unpack_vertex = struct.Struct('<3f').unpack
+    for (raw,) in struct.iter_unpack('12s', vertices):
+        vid = vertex_ids.get(raw)
+        if vid is None:
+            x, y, z = unpack_vertex(raw)
+            position = (round(x / tol), round(y / tol), round(z / tol))
+            vid = vertex_ids[raw] = position_ids.setdefault(position, len(position_ids))
+        ids.append(vid)
+
+    edges = []
+    corners = iter(ids)
+    for a, b, c in zip(corners, corners, corners):
+        edges += ((a << 32 | b) if a < b else (b << 32 | a),
+                  (b << 32 | c) if b < c else (c << 32 | b),
+                  (c << 32 | a) if c < a else (a << 32 | c))
+
+    edge_counts = Counter(edges)
     open_edges = sum(1 for c in edge_counts.values() if c == 1)
     non_manifold_edges = sum(1 for c in edge_counts.values() if c > 2)
     return open_edges, non_manifold_edges
 
-print(f"Using cubeforge version: {cubeforge.__version__}")
-print(f"Outputting STL files to: {output_dir}\n")
-
-print("=" * 70)
-print("MESH OPTIMIZATION DEMONSTRATION")
-print("=" * 70)
-print("\nNOTE: Optimization is now enabled by default!")
-print("Use optimize=False to disable if needed.\n")
-
-# Example 1: Flat 10x10 surface
-print("\n--- Example 1: Flat 10×10 Surface (100 voxels) ---")
-model1 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-for x in range(10):
-    for y in range(10):
-        model1.add_voxel(x, y, 0)
-
-# Save without optimization (explicit)
-file_unopt = os.path.join(output_dir, "surface_10x10_unoptimized.stl")
-model1.save_mesh(file_unopt, format='stl_binary', optimize=False)
-size_unopt = os.path.getsize(file_unopt)
-
-# Save with optimization (default)
-file_opt = os.path.join(output_dir, "surface_10x10_optimized.stl")
-model1.save_mesh(file_opt, format='stl_binary')  # optimize=True by default
-size_opt = os.path.getsize(file_opt)
-
-print(f"Without optimization: {size_unopt:,} bytes")
-print(f"With optimization:    {size_opt:,} bytes (default)")
-print(f"Reduction:            {(1 - size_opt/size_unopt)*100:.1f}% ({size_unopt/size_opt:.1f}x smaller)")
-
-# Example 2: Hollow box (complex interior)
-print("\n--- Example 2: Hollow 10×10×10 Box (488 voxels) ---")
-model2 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-# Create hollow box - walls only
-for x in range(10):
-    for y in range(10):
-        for z in range(10):
-            # Only add voxels on the outer shell
-            if x == 0 or x == 9 or y == 0 or y == 9 or z == 0 or z == 9:
-                model2.add_voxel(x, y, z)
-
-file_unopt2 = os.path.join(output_dir, "hollow_box_unoptimized.stl")
-model2.save_mesh(file_unopt2, format='stl_binary', optimize=False)
-size_unopt2 = os.path.getsize(file_unopt2)
-
-file_opt2 = os.path.join(output_dir, "hollow_box_optimized.stl")
-model2.save_mesh(file_opt2, format='stl_binary')
-size_opt2 = os.path.getsize(file_opt2)
-
-print(f"Without optimization: {size_unopt2:,} bytes")
-print(f"With optimization:    {size_opt2:,} bytes")
-print(f"Reduction:            {(1 - size_opt2/size_unopt2)*100:.1f}% ({size_unopt2/size_opt2:.1f}x smaller)")
-
-# Example 3: L-shaped structure
-print("\n--- Example 3: L-Shaped Building (60 voxels) ---")
-model3 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-# Vertical part of L
-for x in range(3):
-    for y in range(3):
-        for z in range(10):
-            model3.add_voxel(x, y, z)
-
-# Horizontal part of L
-for x in range(3, 7):
-    for y in range(3):
-        for z in range(3):
-            model3.add_voxel(x, y, z)
-
-file_unopt3 = os.path.join(output_dir, "l_shape_unoptimized.stl")
-model3.save_mesh(file_unopt3, format='stl_binary', optimize=False)
-size_unopt3 = os.path.getsize(file_unopt3)
-
-file_opt3 = os.path.join(output_dir, "l_shape_optimized.stl")
-model3.save_mesh(file_opt3, format='stl_binary')
-size_opt3 = os.path.getsize(file_opt3)
-
-print(f"Without optimization: {size_unopt3:,} bytes")
-print(f"With optimization:    {size_opt3:,} bytes")
-print(f"Reduction:            {(1 - size_opt3/size_unopt3)*100:.1f}% ({size_unopt3/size_opt3:.1f}x smaller)")
-
-# Example 4: Stairs (irregular but still benefits from optimization)
-print("\n--- Example 4: Stairs (55 voxels, irregular pattern) ---")
-model4 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-# Create stairs
-for step in range(10):
-    for x in range(5):
-        for y in range(5):
-            for z in range(step + 1):
-                model4.add_voxel(x, y + step, z)
-
-file_unopt4 = os.path.join(output_dir, "stairs_unoptimized.stl")
-model4.save_mesh(file_unopt4, format='stl_binary', optimize=False)
-size_unopt4 = os.path.getsize(file_unopt4)
-
-file_opt4 = os.path.join(output_dir, "stairs_optimized.stl")
-model4.save_mesh(file_opt4, format='stl_binary')
-size_opt4 = os.path.getsize(file_opt4)
-
-print(f"Without optimization: {size_unopt4:,} bytes")
-print(f"With optimization:    {size_opt4:,} bytes")
-print(f"Reduction:            {(1 - size_opt4/size_unopt4)*100:.1f}% ({size_unopt4/size_opt4:.1f}x smaller)")
-
-# Example 5: Tower with windows (complex with holes)
-print("\n--- Example 5: Tower with Windows (280 voxels) ---")
-model5 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-# Build tower with periodic windows
-for z in range(20):
-    for x in range(5):
-        for y in range(5):
-            # Create windows every 4 levels, in the center
-            is_window_level = (z % 4 == 2)
-            is_center = (1 <= x <= 3 and 1 <= y <= 3)
-
-            # Skip center on window levels
-            if not (is_window_level and is_center):
-                model5.add_voxel(x, y, z)
-
-file_unopt5 = os.path.join(output_dir, "tower_windows_unoptimized.stl")
-model5.save_mesh(file_unopt5, format='stl_binary', optimize=False)
-size_unopt5 = os.path.getsize(file_unopt5)
-
-file_opt5 = os.path.join(output_dir, "tower_windows_optimized.stl")
-model5.save_mesh(file_opt5, format='stl_binary')
-size_opt5 = os.path.getsize(file_opt5)
-
-print(f"Without optimization: {size_unopt5:,} bytes")
-print(f"With optimization:    {size_opt5:,} bytes")
-print(f"Reduction:            {(1 - size_opt5/size_unopt5)*100:.1f}% ({size_unopt5/size_opt5:.1f}x smaller)")
-
-# Example 6: Checkerboard pattern (worst case for optimization)
-print("\n--- Example 6: Checkerboard 10×10 (50 voxels, worst case) ---")
-model6 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-# Checkerboard pattern - minimal merging possible
-for x in range(10):
-    for y in range(10):
-        if (x + y) % 2 == 0:
-            model6.add_voxel(x, y, 0)
-
-file_unopt6 = os.path.join(output_dir, "checkerboard_unoptimized.stl")
-model6.save_mesh(file_unopt6, format='stl_binary', optimize=False)
-size_unopt6 = os.path.getsize(file_unopt6)
-
-file_opt6 = os.path.join(output_dir, "checkerboard_optimized.stl")
-model6.save_mesh(file_opt6, format='stl_binary')
-size_opt6 = os.path.getsize(file_opt6)
-
-print(f"Without optimization: {size_unopt6:,} bytes")
-print(f"With optimization:    {size_opt6:,} bytes")
-print(f"Reduction:            {(1 - size_opt6/size_unopt6)*100:.1f}% ({size_unopt6/size_opt6:.1f}x smaller)")
-print("Note: Checkerboard is worst-case - can't merge adjacent faces")
-
-# Example 7: Cross shape (tests merging in multiple directions)
-print("\n--- Example 7: Cross/Plus Shape (76 voxels) ---")
-model7 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up')
-
-# Vertical bar of cross
-for x in range(3, 6):
-    for y in range(10):
-        for z in range(2):
-            model7.add_voxel(x, y, z)
-
-# Horizontal bar of cross
-for x in range(10):
-    for y in range(3, 6):
-        for z in range(2):
-            model7.add_voxel(x, y, z)
-
-file_unopt7 = os.path.join(output_dir, "cross_unoptimized.stl")
-model7.save_mesh(file_unopt7, format='stl_binary', optimize=False)
-size_unopt7 = os.path.getsize(file_unopt7)
-
-file_opt7 = os.path.join(output_dir, "cross_optimized.stl")
-model7.save_mesh(file_opt7, format='stl_binary')
-size_opt7 = os.path.getsize(file_opt7)
-
-print(f"Without optimization: {size_unopt7:,} bytes")
-print(f"With optimization:    {size_opt7:,} bytes")
-print(f"Reduction:            {(1 - size_opt7/size_unopt7)*100:.1f}% ({size_unopt7/size_opt7:.1f}x smaller)")
-
-# Example 8: Random height surface (non-uniform Z)
-print("\n--- Example 8: Random Height Surface Z-up (non-uniform Z) ---")
-random.seed(42)
-grid_size = 32
-min_height = 1.0
-max_additional_height = 5.0
-voxel_dim = (1.0, 0.8, 0.8)
-
-model8 = cubeforge.VoxelModel(voxel_dimensions=voxel_dim, coordinate_system='z_up')
-for x in range(grid_size):
-    for y in range(grid_size):
-        total_height = min_height + random.random() * max_additional_height
-        model8.add_voxel(
-            x * voxel_dim[0],
-            y * voxel_dim[1],
-            0,
-            dimensions=(voxel_dim[0], voxel_dim[1], total_height),
-            anchor=cubeforge.CubeAnchor.CORNER_NEG
-        )
-
-triangles_unopt8 = model8.generate_mesh(optimize=False)
-file_unopt8 = os.path.join(output_dir, "random_height_surface_z_up_unoptimized.stl")
-model8.save_mesh(file_unopt8, format='stl_binary', optimize=False)
-size_unopt8 = os.path.getsize(file_unopt8)
-
-triangles_opt8 = model8.generate_mesh(optimize=True)
-file_opt8 = os.path.join(output_dir, "random_height_surface_z_up_optimized.stl")
-model8.save_mesh(file_opt8, format='stl_binary', optimize=True)
-size_opt8 = os.path.getsize(file_opt8)
-
-open_edges_unopt8, non_manifold_unopt8 = analyze_mesh(triangles_unopt8)
-open_edges_opt8, non_manifold_opt8 = analyze_mesh(triangles_opt8)
-
-print(f"Without optimization: {size_unopt8:,} bytes")
-print(f"With optimization:    {size_opt8:,} bytes")
-print(f"Reduction:            {(1 - size_opt8/size_unopt8)*100:.1f}% ({size_unopt8/size_opt8:.1f}x smaller)")
-print("Mesh topology check (edge counts):")
-print(f"Unoptimized: triangles={len(triangles_unopt8)}, open_edges={open_edges_unopt8}, non_manifold_edges={non_manifold_unopt8}")
-print(f"Optimized:   triangles={len(triangles_opt8)}, open_edges={open_edges_opt8}, non_manifold_edges={non_manifold_opt8}")
-
-print("\n" + "=" * 70)
-print("SUMMARY")
-print("=" * 70)
-print("""
+def save_both(model, output_dir, name):
+    """Saves the model unoptimized and optimized, returning both file sizes."""
+    # save_mesh returns the number of bytes it wrote
+    size_unopt = model.save_mesh(os.path.join(output_dir, f"{name}_unoptimized.stl"),
+                                 format='stl_binary', optimize=False)
+    size_opt = model.save_mesh(os.path.join(output_dir, f"{name}_optimized.stl"),
+                               format='stl_binary')  # optimize=True by default
+    return size_unopt, size_opt
+
+def ply_report(model, output_dir, name, size_opt):
+    """Saves the optimized mesh as quantized PLY and compares it with the STL."""
+    size_ply = model.save_mesh(os.path.join(output_dir, f"{name}_optimized.ply"),
+                               format='ply_quantized')
+    return (f"\nQuantized PLY:        {size_ply:,} bytes "
+            f"({size_opt/size_ply:.1f}x smaller than optimized STL)")
+
+def size_report(size_unopt, size_opt, default=False):
+    """Formats the file size comparison printed for every example."""
+    return (f"Without optimization: {size_unopt:,} bytes\n"
+            f"With optimization:    {size_opt:,} bytes{' (default)' if default else ''}\n"
+            f"Reduction:            {(1 - size_opt/size_unopt)*100:.1f}% ({size_unopt/size_opt:.1f}x smaller)")
+
+# Each example builds and saves its own model and returns the text to print,
+# so the examples can run in parallel and still be reported in order.
+
+def run_example_1(output_dir):
+    # Example 1: Flat 10x10 surface
+    model1 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up',
+                                   bbox=(10, 10, 1))
+    model1.add_voxels([(x, y, 0) for x in range(10) for y in range(10)])
+
+    size_unopt, size_opt = save_both(model1, output_dir, "surface_10x10")
+    return ("\n--- Example 1: Flat 10×10 Surface (100 voxels) ---\n"
+            + size_report(size_unopt, size_opt, default=True)
+            + ply_report(model1, output_dir, "surface_10x10", size_opt))
+
+def run_example_2(output_dir):
+    # Example 2: Hollow box (complex interior) - walls only
+    model2 = cubeforge.primitives.hollow_box(10, 10, 10, coordinate_system='z_up')
+
+    size_unopt, size_opt = save_both(model2, output_dir, "hollow_box")
+    return ("\n--- Example 2: Hollow 10×10×10 Box (488 voxels) ---\n"
+            + size_report(size_unopt, size_opt)
+            + ply_report(model2, output_dir, "hollow_box", size_opt))
+
+def run_example_3(output_dir):
+    # Example 3: L-shaped structure
+    model3 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up',
+                                   bbox=(7, 3, 10))
+
+    # Vertical part of L
+    model3.add_voxels([(x, y, z) for x in range(3) for y in range(3) for z in range(10)])
+
+    # Horizontal part of L
+    model3.add_voxels([(x, y, z) for x in range(3, 7) for y in range(3) for z in range(3)])
+
+    size_unopt, size_opt = save_both(model3, output_dir, "l_shape")
+    return ("\n--- Example 3: L-Shaped Building (60 voxels) ---\n"
+            + size_report(size_unopt, size_opt))
+
+def run_example_4(output_dir):
+    # Example 4: Stairs (irregular but still benefits from optimization)
+    model4 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up',
+                                   bbox=(5, 14, 10))
+
+    # Create stairs
+    model4.add_voxels([(x, y + step, z) for step in range(10) for x in range(5)
+                       for y in range(5) for z in range(step + 1)])
+
+    size_unopt, size_opt = save_both(model4, output_dir, "stairs")
+    return ("\n--- Example 4: Stairs (55 voxels, irregular pattern) ---\n"
+            + size_report(size_unopt, size_opt))
+
+def run_example_5(output_dir):
+    # Example 5: Tower with windows (complex with holes)
+    model5 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up',
+                                   bbox=(5, 5, 20))
+
+    # Build tower with periodic windows: every 4 levels, skip the center
+    model5.add_voxels([(x, y, z) for z in range(20) for x in range(5) for y in range(5)
+                       if not (z % 4 == 2 and 1 <= x <= 3 and 1 <= y <= 3)])
+
+    size_unopt, size_opt = save_both(model5, output_dir, "tower_windows")
+    return ("\n--- Example 5: Tower with Windows (280 voxels) ---\n"
+            + size_report(size_unopt, size_opt))
+
+def run_example_6(output_dir):
+    # Example 6: Checkerboard pattern (worst case for optimization) - minimal merging possible
+    model6 = cubeforge.primitives.checkerboard(10, 10, coordinate_system='z_up')
+
+    size_unopt, size_opt = save_both(model6, output_dir, "checkerboard")
+    return ("\n--- Example 6: Checkerboard 10×10 (50 voxels, worst case) ---\n"
+            + size_report(size_unopt, size_opt)
+            + "\nNote: Checkerboard is worst-case - can't merge adjacent faces")
+
+def run_example_7(output_dir):
+    # Example 7: Cross shape (tests merging in multiple directions)
+    model7 = cubeforge.VoxelModel(voxel_dimensions=(1.0, 1.0, 1.0), coordinate_system='z_up',
+                                   bbox=(10, 10, 2))
+
+    # Vertical bar of cross
+    model7.add_voxels([(x, y, z) for x in range(3, 6) for y in range(10) for z in range(2)])
+
+    # Horizontal bar of cross
+    model7.add_voxels([(x, y, z) for x in range(10) for y in range(3, 6) for z in range(2)])
+
+    size_unopt, size_opt = save_both(model7, output_dir, "cross")
+    return ("\n--- Example 7: Cross/Plus Shape (76 voxels) ---\n"
+            + size_report(size_unopt, size_opt))
+
+def run_example_8(output_dir):
+    # Example 8: Random height surface (non-uniform Z)
+    rng = random.Random(42)
+    grid_size = 32
+    min_height = 1.0
+    max_additional_height = 5.0
+    voxel_dim = (1.0, 0.8, 0.8)
+
+    model8 = cubeforge.VoxelModel(voxel_dimensions=voxel_dim, coordinate_system='z_up',
+                                  bbox=(grid_size, grid_size, 1))
+    # One column per cell, each with its own random height, added in one call
+    cells = [(x, y) for x in range(grid_size) for y in range(grid_size)]
+    model8.add_voxels(
+        [(x * voxel_dim[0], y * voxel_dim[1], 0) for x, y in cells],
+        dimensions=[(voxel_dim[0], voxel_dim[1], min_height + rng.random() * max_additional_height)
+                    for _ in cells],
+        anchor=cubeforge.CubeAnchor.CORNER_NEG
+    )
+
+    size_unopt, size_opt = save_both(model8, output_dir, "random_height_surface_z_up")
+
+    # Analyze the flat float32 buffers rather than lists of triangle tuples
+    normals_unopt8, vertices_unopt8 = model8.generate_mesh(optimize=False, flat=True)
+    normals_opt8, vertices_opt8 = model8.generate_mesh(optimize=True, flat=True)
+    open_edges_unopt8, non_manifold_unopt8 = analyze_mesh(vertices_unopt8)
+    open_edges_opt8, non_manifold_opt8 = analyze_mesh(vertices_opt8)
+
+    return ("\n--- Example 8: Random Height Surface Z-up (non-uniform Z) ---\n"
+            + size_report(size_unopt, size_opt) + "\n"
+            + "Mesh topology check (edge counts):\n"
+            + f"Unoptimized: triangles={len(normals_unopt8) // 3}, open_edges={open_edges_unopt8}, non_manifold_edges={non_manifold_unopt8}\n"
+            + f"Optimized:   triangles={len(normals_opt8) // 3}, open_edges={open_edges_opt8}, non_manifold_edges={non_manifold_opt8}")
+
+EXAMPLES = [run_example_1, run_example_2, run_example_3, run_example_4,
+            run_example_5, run_example_6, run_example_7, run_example_8]
+
+def run_captured(run_example, output_dir):
+    """
+    Runs one example in a worker process.
+
+    Returns the example's log output along with its report text, so the
+    parent process can write both out in example order.
+    """
+    root = logging.getLogger()
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(root.handlers[0].formatter)
+    saved_handlers = root.handlers
+    root.handlers = [handler]
+    try:
+        report = run_example(output_dir)
+    finally:
+        root.handlers = saved_handlers
+    return stream.getvalue(), report
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Demonstrate greedy mesh optimization.")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="number of worker processes to run the examples in (default: 1, serial)")
+    args = parser.parse_args()
+
+    # Each block of text is collected into lines and written out at once
+    lines = [f"Using cubeforge version: {cubeforge.__version__}",
+             f"Outputting STL and PLY files to: {output_dir}\n",
+             "=" * 70,
+             "MESH OPTIMIZATION DEMONSTRATION",
+             "=" * 70,
+             "\nNOTE: Optimization is now enabled by default!",
+             "Use optimize=False to disable if needed.\n"]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if args.jobs > 1:
+        # The examples are too small to gain much from worker processes, so
+        # the pool is opt-in. Each worker hands back its example's log lines
+        # with its report, and both are written out in example order.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = executor.map(run_captured, EXAMPLES, [output_dir] * len(EXAMPLES))
+            for log_text, report in results:
+                sys.stderr.write(log_text)
+                sys.stdout.write(report + "\n")
+    else:
+        for run_example in EXAMPLES:
+            sys.stdout.write(run_example(output_dir) + "\n")
+
+    lines = ["\n" + "=" * 70,
+             "SUMMARY",
+             "=" * 70,
+             """
 Greedy meshing optimization is now ENABLED BY DEFAULT.
 
 The algorithm merges adjacent coplanar voxel faces into larger rectangles,
@@ -285,9 +276,9 @@ To disable optimization (not recommended):
 
 To explicitly enable (now redundant):
   model.save_mesh("file.stl", optimize=True)  # Default behavior
-""")
-
-print("=" * 70)
-print("Files saved to:", output_dir)
-print("Open the STL files in your viewer to verify correctness!")
-print("=" * 70)
+""",
+             "=" * 70,
+             f"Files saved to: {output_dir}",
+             "Open the STL files in your viewer to verify correctness!",
+             "=" * 70]
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -0,0 +1,100 @@
+import time
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from cubeforge import VoxelModel
+
+
+def mesh_area(triangles):
+    area = 0.0
+    for _, a, b, c in triangles:
+        u = [b[i] - a[i] for i in range(3)]
+        v = [c[i] - a[i] for i in range(3)]
+        cross = (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+        area += sum(x * x for x in cross) ** 0.5 / 2
+    return area
+
+
+def mesh_bounds(triangles):
+    points = [vertex for triangle in triangles for vertex in triangle[1:]]
+    return tuple(min(p[i] for p in points) for i in range(3)), tuple(max(p[i] for p in points) for i in range(3))
+
+
+@pytest.mark.parametrize('coordinate_system', ['y_up', 'z_up'])
+def test_changing_voxel_dimensions_moves_voxels_to_the_new_grid(coordinate_system):
+    model = VoxelModel(coordinate_system=coordinate_system)
+    model.add_voxels([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    assert mesh_bounds(model.generate_mesh()) == ((0, 0, 0), (2, 2, 1))
+
+    # Existing voxels keep their grid cells and their own size
+    model.voxel_dimensions = (2, 3, 4)
+    assert model.voxel_dimensions == (2.0, 3.0, 4.0)
+    for optimize in (True, False):
+        assert mesh_bounds(model.generate_mesh(optimize=optimize)) == ((0, 0, 0), (3, 4, 1))
+
+    model.voxel_dimensions = (1, 1, 1)
+    assert mesh_bounds(model.generate_mesh()) == ((0, 0, 0), (2, 2, 1))
+
+
+def test_changing_voxel_dimensions_recounts_non_uniform_voxels():
+    model = VoxelModel()
+    model.add_voxel(0, 0, 0)
+    model.add_voxel(1, 0, 0, dimensions=(2, 1, 1))
+    model.generate_mesh()
+
+    # The custom-sized voxel now matches the default and the other no longer does
+    model.voxel_dimensions = (2, 1, 1)
+    assert model._nonuniform_count == 1
+    assert mesh_bounds(model.generate_mesh()) == ((0, 0, 0), (4, 1, 1))
+
+
+def test_invalid_voxel_dimensions_are_rejected():
+    model = VoxelModel()
+    for invalid in [(1, 1), (1, 0, 1), 'abc', None]:
+        with pytest.raises(ValueError):
+            model.voxel_dimensions = invalid
+        with pytest.raises(ValueError):
+            VoxelModel(voxel_dimensions=invalid)
+    assert model.voxel_dimensions == (1.0, 1.0, 1.0)
+
+
+def test_large_voxel_next_to_many_small_ones_meshes_quickly():
+    # Face lookups must not scale with the large voxel's surface in cells
+    size = 2000
+    small = [(size, y, z) for y in range(0, 60, 2) for z in range(0, 60, 2)]
+    model = VoxelModel()
+    model.add_voxel(0, 0, 0, dimensions=(size, size, size))
+    model.add_voxels(small)
+
+    start = time.perf_counter()
+    triangles = model.generate_mesh(optimize=False)
+    elapsed = time.perf_counter() - start
+
+    # Each small voxel hides one cell of the large face and one of its own
+    assert mesh_area(triangles) == pytest.approx(6 * size * size + 4 * len(small))
+    assert elapsed < 1.0
+
+
+def test_repeated_generate_mesh_returns_the_cached_tuple():
+    model = VoxelModel()
+    model.add_voxels([(0, 0, 0), (1, 0, 0)])
+    triangles = model.generate_mesh()
+    assert isinstance(triangles, tuple)
+    assert model.generate_mesh() is triangles
+    assert model.generate_mesh(optimize=False) is not triangles
+
+    model.add_voxel(2, 0, 0)
+    assert model.generate_mesh() is not triangles
+    assert len(model.generate_mesh()) == len(triangles)
+
+
+def test_add_voxels_accepts_shared_dimensions_of_any_numeric_type():
+    coordinates = [(0, 0, 0), (2, 0, 0), (4, 0, 0)]
+    expected = VoxelModel()
+    expected.add_voxels(coordinates, dimensions=(2.0, 1.0, 1.0))
+    for dimensions in [(Fraction(2), Fraction(1), Fraction(1)), (Decimal(2), Decimal(1), Decimal(1))]:
+        model = VoxelModel()
+        model.add_voxels(coordinates, dimensions=dimensions)
+        assert model.generate_mesh() == expected.generate_mesh()
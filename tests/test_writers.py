@@ -0,0 +1,64 @@
+import struct
+
+import pytest
+
+from cubeforge import VoxelModel
+
+
+def read_quantized_ply(filename):
+    """Returns the (v1, v2, v3) world-space corners of every face."""
+    with open(filename, 'rb') as f:
+        header, _, body = f.read().partition(b'end_header\n')
+    for line in header.decode('utf-8').splitlines():
+        fields = line.split()
+        if fields[:2] == ['comment', 'quantization_offset']:
+            offset = [float(v) for v in fields[2:]]
+        elif fields[:2] == ['comment', 'quantization_scale']:
+            scale = [float(v) for v in fields[2:]]
+        elif fields[:2] == ['element', 'vertex']:
+            vertex_count = int(fields[2])
+        elif fields[:2] == ['element', 'face']:
+            face_count = int(fields[2])
+    assert len(body) == 6 * vertex_count + 13 * face_count
+    stored = struct.unpack_from(f'<{3 * vertex_count}H', body)
+    vertices = [tuple(offset[axis] + stored[3 * i + axis] * scale[axis] for axis in range(3))
+                for i in range(vertex_count)]
+    faces = [struct.unpack_from('<B3I', body, 6 * vertex_count + 13 * i) for i in range(face_count)]
+    return [tuple(vertices[index] for index in face[1:]) for face in faces]
+
+
+def as_float32(point):
+    return struct.pack('<3f', *point)
+
+
+def spaced_model():
+    model = VoxelModel(voxel_dimensions=(0.8, 0.8, 0.8))
+    model.add_voxels([(x * 0.8, y * 0.8, z * 0.8) for x in range(12) for y in range(3) for z in range(2)
+                      if (x + y) % 3])
+    return model
+
+
+def mixed_model():
+    model = VoxelModel(voxel_dimensions=(0.1, 0.1, 0.1))
+    sizes = [0.1, 0.3, 0.7, 0.3, 0.1, 0.7, 0.7, 0.1]
+    x = 0.0
+    for i, size in enumerate(sizes):
+        model.add_voxel(x, 0.1 * (i % 3), 0.0, dimensions=(size, 0.3, 0.1))
+        x += size
+    return model
+
+
+@pytest.mark.parametrize('build', [spaced_model, mixed_model])
+@pytest.mark.parametrize('optimize', [True, False])
+def test_quantized_ply_recovers_grid_vertices_exactly(tmp_path, build, optimize):
+    model = build()
+    filename = str(tmp_path / 'model.ply')
+    model.save_mesh(filename, format='ply_quantized', optimize=optimize)
+
+    triangles = model.generate_mesh(optimize=optimize)
+    faces = read_quantized_ply(filename)
+    assert len(faces) == len(triangles)
+    for (_, *corners), face in zip(triangles, faces):
+        for corner, stored in zip(corners, face):
+            assert as_float32(stored) == as_float32(corner)
+            assert stored == pytest.approx(corner, abs=1e-9)